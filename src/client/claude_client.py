@@ -582,7 +582,8 @@ class ClaudeClient:
         language: str = "ko",
         model: Optional[str] = None,
         use_scientific_skills: bool = False,
-        scientific_style: Literal["peer-review", "literature-review", "scientific-critical-thinking", "scientific-writing"] = "peer-review"
+        scientific_style: Literal["peer-review", "literature-review", "scientific-critical-thinking", "scientific-writing"] = "peer-review",
+        cache_system: bool = True
     ) -> str:
         """
         논문 리뷰 생성
@@ -599,6 +600,8 @@ class ClaudeClient:
                 - "literature-review": 문헌 리뷰 관점
                 - "scientific-critical-thinking": 비판적 분석 관점
                 - "scientific-writing": 커뮤니케이션 관점
+            cache_system: 고정 시스템 프롬프트에 Anthropic 프롬프트 캐싱 적용 여부
+                - 연속 리뷰 생성 시 고정 프리픽스의 입력 토큰 비용/지연을 크게 줄임
 
         Returns:
             생성된 논문 리뷰 (마크다운 형식)
@@ -671,15 +674,36 @@ class ClaudeClient:
 
 위 체크포인트들을 리뷰에 자연스럽게 반영해주세요."""
 
+            system_text = "You are a junior AI engineer writing blog posts for learning and study purposes. Write in a natural, column-style format without numbered lists or overly structured sections. Focus on problem definition and its significance. Use past tense declarative style (했다체) in Korean, ending sentences with forms like '했다', '제시했다', '설명했다'."
+
+            if cache_system:
+                # 고정 시스템 프롬프트를 캐시 가능한 블록으로 전달
+                # (5분 TTL 내 연속 호출 시 캐시된 구간 비용이 10%로 줄어듦)
+                system_param = [{
+                    "type": "text",
+                    "text": system_text,
+                    "cache_control": {"type": "ephemeral"},
+                }]
+            else:
+                system_param = system_text
+
             response = self.client.messages.create(
                 model=review_model,
                 max_tokens=8000,
-                system="You are a junior AI engineer writing blog posts for learning and study purposes. Write in a natural, column-style format without numbered lists or overly structured sections. Focus on problem definition and its significance. Use past tense declarative style (했다체) in Korean, ending sentences with forms like '했다', '제시했다', '설명했다'.",
+                system=system_param,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
 
+            # 캐시 적중 여부 확인용 로그 (캐시가 전혀 안 붙는 경우를 조기 발견)
+            usage = getattr(response, 'usage', None)
+            if usage is not None:
+                logger.debug(
+                    f"프롬프트 캐시 토큰: creation={getattr(usage, 'cache_creation_input_tokens', 0)}, "
+                    f"read={getattr(usage, 'cache_read_input_tokens', 0)}"
+                )
+
             if not response.content:
                 raise ValueError("Claude API 응답이 비어있습니다.")
 
@@ -692,6 +716,136 @@ class ClaudeClient:
             logger.error(f"논문 리뷰 생성 오류: {e}", exc_info=True)
             raise
 
+    async def generate_paper_review_async(
+        self,
+        paper: Dict,
+        language: str = "ko",
+        model: Optional[str] = None,
+        use_scientific_skills: bool = False,
+        scientific_style: Literal["peer-review", "literature-review", "scientific-critical-thinking", "scientific-writing"] = "peer-review",
+        cache_system: bool = True
+    ) -> str:
+        """
+        논문 리뷰 생성 (비동기)
+
+        동기 generate_paper_review를 워커 스레드로 넘겨 이벤트 루프를
+        막지 않습니다. 여러 논문을 asyncio.gather로 동시에 처리할 때
+        사용합니다. 인자는 generate_paper_review와 동일합니다.
+        """
+        import asyncio
+        return await asyncio.to_thread(
+            self.generate_paper_review,
+            paper,
+            language=language,
+            model=model,
+            use_scientific_skills=use_scientific_skills,
+            scientific_style=scientific_style,
+            cache_system=cache_system
+        )
+
+    def generate_paper_reviews_batch(
+        self,
+        papers: List[Dict],
+        language: str = "ko",
+        model: Optional[str] = None,
+        cache_system: bool = True
+    ) -> List[str]:
+        """
+        여러 논문의 리뷰를 한 번의 API 호출로 일괄 생성
+
+        논문별로 개별 호출하는 대신 메타데이터를 하나의 메시지로 묶어
+        왕복 횟수를 줄입니다. 응답 파싱에 실패하면 호출자가
+        논문별 개별 호출로 폴백할 수 있도록 예외를 발생시킵니다.
+
+        Args:
+            papers: 논문 정보 리스트 (title, authors, year, abstract 등)
+            language: 출력 언어 (ko, en)
+            model: 사용할 모델 (None이면 self.model 사용)
+            cache_system: 고정 시스템 프롬프트에 프롬프트 캐싱 적용 여부
+
+        Returns:
+            논문 순서와 동일한 리뷰(마크다운) 리스트
+        """
+        import json
+        import re
+
+        review_model = model if model else self.model
+
+        # 논문 메타데이터를 번호 매긴 블록으로 변환
+        blocks = []
+        for i, paper in enumerate(papers, 1):
+            authors = ', '.join(paper.get('authors', [])[:3]) if isinstance(paper.get('authors'), list) else str(paper.get('authors', 'N/A'))
+            blocks.append(
+                f"[논문 {i}]\n"
+                f"- 제목: {paper.get('title', 'N/A')}\n"
+                f"- 저자: {authors}\n"
+                f"- 발행년도: {paper.get('year', 'N/A')}\n"
+                f"- 인용수: {paper.get('citations', 'N/A')}\n"
+                f"- 초록: {paper.get('abstract', 'N/A')}\n"
+                f"- 논문 링크: {paper.get('url', 'N/A')}"
+            )
+        papers_text = "\n\n".join(blocks)
+
+        prompt = f"""다음 {len(papers)}개 논문 각각에 대해 기술 블로그 스타일의 상세한 리뷰를 한국어로 작성해주세요:
+
+{papers_text}
+
+반드시 다음 JSON 형식으로 응답해주세요. reviews 배열의 각 원소는 해당 번호 논문의 마크다운 리뷰 전문입니다:
+{{
+  "reviews": [
+    "논문 1 리뷰 (마크다운)",
+    "논문 2 리뷰 (마크다운)",
+    ...
+  ]
+}}
+
+정확히 {len(papers)}개의 리뷰를 순서대로 반환해주세요."""
+
+        system_text = "You are a junior AI engineer writing blog posts for learning and study purposes. Write in a natural, column-style format without numbered lists or overly structured sections. Focus on problem definition and its significance. Use past tense declarative style (했다체) in Korean, ending sentences with forms like '했다', '제시했다', '설명했다'."
+
+        if cache_system:
+            system_param = [{
+                "type": "text",
+                "text": system_text,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        else:
+            system_param = system_text
+
+        try:
+            response = self.client.messages.create(
+                model=review_model,
+                max_tokens=8000,
+                system=system_param,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+            if not response.content:
+                raise ValueError("Claude API 응답이 비어있습니다.")
+
+            response_content = response.content[0].text
+
+            try:
+                result = json.loads(response_content)
+            except json.JSONDecodeError:
+                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_content, re.DOTALL)
+                if not json_match:
+                    raise
+                result = json.loads(json_match.group(1))
+
+            reviews = result.get('reviews', [])
+            if len(reviews) != len(papers):
+                raise ValueError(f"리뷰 개수 불일치: 요청 {len(papers)}개, 응답 {len(reviews)}개")
+
+            logger.info(f"{len(reviews)}개 논문 리뷰 일괄 생성 완료")
+            return [str(r) for r in reviews]
+
+        except Exception as e:
+            logger.error(f"논문 리뷰 일괄 생성 오류: {e}")
+            raise
+
     def _get_scientific_supplement(self, style: str = "peer-review") -> str:
         """
         Scientific Skills 보조 가이드 가져오기
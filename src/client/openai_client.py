@@ -2,13 +2,118 @@
 OpenAI API 클라이언트
 """
 import logging
-import yaml
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional
-from openai import OpenAI
+
+# openai/httpx/yaml은 임포트 비용이 커서 실제 사용 시점에 지연 임포트함
+# (OpenAI를 쓰지 않는 CLI 경로에서 모듈 임포트 비용을 지불하지 않도록)
+
+# 응답 JSON 파싱 가속: orjson이 있으면 사용, 없으면 표준 json으로 폴백
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json as _json
+    _loads = _json.loads
+    _JSONDecodeError = _json.JSONDecodeError
 
 logger = logging.getLogger(__name__)
 
+# 마크다운 코드 블록에서 JSON을 추출하기 위한 패턴 (모듈 레벨에서 한 번만 컴파일)
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+
+# 응답 스키마 검증용 msgspec (선택적 의존성 - 없으면 dict 그대로 사용)
+try:
+    import msgspec
+
+    class PaperDetails(msgspec.Struct):
+        """논문 상세 정보 항목 스키마"""
+        title: str
+        authors: List[str] = []
+        year: Optional[int] = None
+        citations: Optional[int] = None
+        importance_score: Optional[int] = None
+        url: Optional[str] = None
+        abstract: Optional[str] = None
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    logger.debug("msgspec not available - response schema validation disabled")
+
+
+def _validate_papers(papers: List[Dict]) -> List[Dict]:
+    """
+    논문 항목 스키마 검증/정규화
+
+    msgspec이 있으면 각 항목을 PaperDetails 스키마로 검증하여 타입을 정규화하고
+    형식이 깨진 항목은 제외함. msgspec이 없으면 입력을 그대로 반환.
+    """
+    if not MSGSPEC_AVAILABLE or not isinstance(papers, list):
+        return papers
+
+    validated = []
+    for item in papers:
+        try:
+            paper = msgspec.convert(item, type=PaperDetails, strict=False)
+            validated.append(msgspec.to_builtins(paper))
+        except msgspec.ValidationError as e:
+            logger.debug(f"논문 항목 스키마 검증 실패 (건너뜀): {e}")
+    return validated
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelCaps:
+    """모델별 API 호환성 정보 (호출마다 문자열 검사를 반복하지 않도록 미리 계산)"""
+    supports_response_format: bool  # response_format={"type": "json_object"} 지원 여부
+    token_param_name: str  # "max_tokens" 또는 "max_completion_tokens"
+    is_reasoning_model: bool  # gpt-5/o1 계열 여부
+
+
+_CAPS_CACHE: Dict[str, _ModelCaps] = {}
+
+
+def _capabilities_for(model: str) -> _ModelCaps:
+    """모델 이름으로 호환성 정보 계산 (캐시됨)"""
+    caps = _CAPS_CACHE.get(model)
+    if caps is None:
+        m = model.lower()
+        is_reasoning = "gpt-5" in m or "o1" in m
+        caps = _ModelCaps(
+            supports_response_format="gpt-4" in m or "gpt-3.5" in m,
+            token_param_name="max_completion_tokens" if is_reasoning else "max_tokens",
+            is_reasoning_model=is_reasoning,
+        )
+        _CAPS_CACHE[model] = caps
+    return caps
+
+# 모든 OpenAIClient 인스턴스가 공유하는 httpx 클라이언트
+# (기본 풀 제한이 작아서 동시 리뷰 생성 시 커넥션이 병목이 됨)
+_SHARED_HTTP = None
+
+
+def _get_shared_http():
+    """공유 httpx 클라이언트 반환 (없으면 생성)"""
+    global _SHARED_HTTP
+    if _SHARED_HTTP is None or _SHARED_HTTP.is_closed:
+        import httpx
+        _SHARED_HTTP = httpx.Client(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=60,
+        )
+    return _SHARED_HTTP
+
+
+def close_shared_http():
+    """공유 httpx 클라이언트 종료 (프로그램 종료 시 호출)"""
+    global _SHARED_HTTP
+    if _SHARED_HTTP is not None and not _SHARED_HTTP.is_closed:
+        _SHARED_HTTP.close()
+    _SHARED_HTTP = None
+
 
 class OpenAIClient:
     """
@@ -30,12 +135,18 @@ class OpenAIClient:
                   - gpt-5.2: 최신 모델 (max_completion_tokens 사용)
             prompts_file: 프롬프트 설정 파일 경로
         """
-        self.client = OpenAI(api_key=api_key)
+        from openai import OpenAI
+
+        # 커넥션 풀을 공유하여 인스턴스마다 httpx.Client를 새로 만들지 않음
+        self.client = OpenAI(api_key=api_key, http_client=_get_shared_http())
         self.model = model
+        self._caps = _capabilities_for(model)
         self.prompts = self._load_prompts(prompts_file)
     
     def _load_prompts(self, prompts_file: str) -> Dict:
         """프롬프트 파일 로드"""
+        import yaml
+
         try:
             prompts_path = Path(prompts_file)
             if not prompts_path.is_absolute():
@@ -69,7 +180,80 @@ class OpenAIClient:
             for key in missing_keys:
                 template = template.replace(f'{{{key}}}', 'N/A')
             return template.format(**kwargs)
-    
+
+    def _chat_json(
+        self,
+        system: str,
+        user: str,
+        max_tokens: int,
+        reasoning_max_tokens: Optional[int] = None,
+        temperature: float = 0.7
+    ) -> Dict:
+        """
+        JSON 응답을 받는 공통 호출 헬퍼
+
+        파라미터 구성 → API 호출 → 응답 검증 → JSON 파싱(코드 블록 폴백)까지
+        generate_paper_* 메서드들이 반복하던 패턴을 한 곳으로 모음.
+
+        Args:
+            system: 시스템 프롬프트
+            user: 사용자 프롬프트
+            max_tokens: 일반 모델용 최대 토큰 수
+            reasoning_max_tokens: gpt-5/o1 계열용 최대 토큰 수 (None이면 max_tokens 사용)
+            temperature: 샘플링 온도
+
+        Returns:
+            파싱된 JSON 응답 (dict)
+        """
+        completion_params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            "temperature": temperature
+        }
+
+        if self._caps.supports_response_format:
+            completion_params["response_format"] = {"type": "json_object"}
+
+        if reasoning_max_tokens is None:
+            reasoning_max_tokens = max_tokens
+        completion_params[self._caps.token_param_name] = (
+            reasoning_max_tokens if self._caps.is_reasoning_model else max_tokens
+        )
+
+        response = self.client.chat.completions.create(**completion_params)
+
+        # 응답 확인
+        if not response.choices or not response.choices[0].message:
+            raise ValueError("OpenAI API 응답에 choices가 없습니다.")
+
+        response_content = response.choices[0].message.content
+
+        if not response_content or not response_content.strip():
+            logger.error(f"OpenAI API 응답이 비어있습니다. 전체 응답: {response}")
+            raise ValueError("OpenAI API 응답이 비어있습니다.")
+
+        logger.debug(f"응답 길이: {len(response_content)} bytes")
+        logger.debug(f"응답 시작 부분: {response_content[:200]}")
+
+        try:
+            return _loads(response_content)
+        except _JSONDecodeError as e:
+            # 마크다운 코드 블록에서 JSON 추출 시도
+            json_match = _CODEBLOCK_RE.search(response_content)
+            if json_match:
+                try:
+                    result = _loads(json_match.group(1))
+                    logger.info("코드 블록에서 JSON 추출 성공")
+                    return result
+                except Exception:
+                    pass
+            logger.error(f"JSON 파싱 오류: {e}")
+            logger.error(f"응답 내용: {response_content[:1000]}")
+            raise
+
     def generate_paper_list_titles_only(
         self,
         topic: str = "AI/ML",
@@ -111,9 +295,11 @@ class OpenAIClient:
             
             exclude_text = ""
             if exclude_titles:
-                exclude_text = f"\n\n중요: 다음 논문들은 이미 수집되었으므로 제외하고 새로운 논문만 제시해주세요:\n"
-                for title in exclude_titles[:100]:  # 제목만이므로 더 많이
-                    exclude_text += f"- {title}\n"
+                # 문자열 누적(+=) 대신 join으로 한 번에 생성
+                exclude_text = (
+                    "\n\n중요: 다음 논문들은 이미 수집되었으므로 제외하고 새로운 논문만 제시해주세요:\n"
+                    + "".join(f"- {title}\n" for title in exclude_titles[:100])  # 제목만이므로 더 많이
+                )
             
             prompt = self._format_prompt(
                 prompt_template,
@@ -122,76 +308,30 @@ class OpenAIClient:
                 recent_years=recent_years
             ) + exclude_text
             
-            completion_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in academic paper analysis. Generate a list of paper titles only. You MUST respond with valid JSON format containing a 'titles' array of strings."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.7
-            }
-            
-            if "gpt-4" in self.model.lower() or "gpt-3.5" in self.model.lower():
-                completion_params["response_format"] = {"type": "json_object"}
-            
             # 제목만이므로 토큰 수 계산: 제목 하나당 평균 100토큰, 200개면 20000토큰 필요
-            if "gpt-5" in self.model.lower() or "o1" in self.model.lower():
-                completion_params["max_completion_tokens"] = 8000  # 충분히 크게
-            else:
-                completion_params["max_tokens"] = 6000
-            
-            response = self.client.chat.completions.create(**completion_params)
-            
-            import json
-            import re
-            
-            # 응답 확인
-            if not response.choices or not response.choices[0].message:
-                raise ValueError("OpenAI API 응답에 choices가 없습니다.")
-            
-            response_content = response.choices[0].message.content
-            
-            if not response_content or not response_content.strip():
-                raise ValueError("OpenAI API 응답이 비어있습니다.")
-            
-            logger.debug(f"논문 제목 리스트 응답 길이: {len(response_content)} bytes")
-            logger.debug(f"논문 제목 리스트 응답 시작 부분: {response_content[:200]}")
-            
-            try:
-                result = json.loads(response_content)
-                titles = result.get('titles', [])
-                
-                if not titles:
-                    # 하위 호환성: 'papers' 키 확인
-                    if 'papers' in result:
-                        titles = [p.get('title', '') if isinstance(p, dict) else str(p) for p in result['papers']]
-                    elif isinstance(result, list):
-                        titles = [str(t) for t in result]
-                    logger.warning(f"논문 제목 리스트가 0개입니다. 응답 구조: {list(result.keys()) if isinstance(result, dict) else 'list'}")
-                
-                # 문자열로 변환 및 필터링
-                titles = [str(t).strip() for t in titles if t]
-                
-                logger.info(f"{len(titles)}개의 논문 제목 리스트 생성 완료")
-                return titles
-            except json.JSONDecodeError as e:
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_content, re.DOTALL)
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(1))
-                        titles = result.get('titles', [])
-                        if not titles and 'papers' in result:
-                            # 하위 호환성
-                            titles = [p.get('title', '') if isinstance(p, dict) else str(p) for p in result['papers']]
-                        titles = [str(t).strip() for t in titles if t]
-                        logger.info(f"코드 블록에서 JSON 추출 성공: {len(titles)}개 논문 제목")
-                        return titles
-                    except:
-                        pass
-                logger.error(f"JSON 파싱 오류: {e}")
-                logger.error(f"응답 내용: {response_content[:1000]}")
-                raise
-                
+            result = self._chat_json(
+                system="You are an expert in academic paper analysis. Generate a list of paper titles only. You MUST respond with valid JSON format containing a 'titles' array of strings.",
+                user=prompt,
+                max_tokens=6000,
+                reasoning_max_tokens=8000
+            )
+
+            titles = result.get('titles', []) if isinstance(result, dict) else []
+
+            if not titles:
+                # 하위 호환성: 'papers' 키 확인
+                if isinstance(result, dict) and 'papers' in result:
+                    titles = [p.get('title', '') if isinstance(p, dict) else str(p) for p in result['papers']]
+                elif isinstance(result, list):
+                    titles = [str(t) for t in result]
+                logger.warning(f"논문 제목 리스트가 0개입니다. 응답 구조: {list(result.keys()) if isinstance(result, dict) else 'list'}")
+
+            # 문자열로 변환 및 필터링
+            titles = [str(t).strip() for t in titles if t]
+
+            logger.info(f"{len(titles)}개의 논문 제목 리스트 생성 완료")
+            return titles
+
         except Exception as e:
             logger.error(f"논문 제목 리스트 생성 오류: {e}", exc_info=True)
             raise
@@ -249,77 +389,33 @@ class OpenAIClient:
   ]
 }}"""
             
-            # 논문 제목 리스트를 텍스트로 변환
-            papers_text = ""
-            for i, title in enumerate(paper_titles, 1):
-                papers_text += f"{i}. {title}\n"
+            # 논문 제목 리스트를 텍스트로 변환 (join으로 한 번에 생성)
+            papers_text = "".join(f"{i}. {title}\n" for i, title in enumerate(paper_titles, 1))
             
             prompt = self._format_prompt(
                 prompt_template,
                 papers_list=papers_text
             )
             
-            completion_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in academic paper analysis. Add detailed information (arxiv_id, url, abstract) to the given paper list. You MUST respond with valid JSON format containing a 'papers' array."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.7
-            }
-            
-            if "gpt-4" in self.model.lower() or "gpt-3.5" in self.model.lower():
-                completion_params["response_format"] = {"type": "json_object"}
-            
             # 상세 정보이므로 더 많은 토큰 필요
-            if "gpt-5" in self.model.lower() or "o1" in self.model.lower():
-                completion_params["max_completion_tokens"] = 4000
-            else:
-                completion_params["max_tokens"] = 3000
-            
-            response = self.client.chat.completions.create(**completion_params)
-            
-            import json
-            import re
-            
-            # 응답 확인
-            if not response.choices or not response.choices[0].message:
-                raise ValueError("OpenAI API 응답에 choices가 없습니다.")
-            
-            response_content = response.choices[0].message.content
-            
-            if not response_content or not response_content.strip():
-                logger.error(f"OpenAI API 응답이 비어있습니다. 전체 응답: {response}")
-                raise ValueError("OpenAI API 응답이 비어있습니다.")
-            
-            logger.debug(f"논문 상세 정보 응답 길이: {len(response_content)} bytes")
-            logger.debug(f"논문 상세 정보 응답 시작 부분: {response_content[:200]}")
-            
-            try:
-                result = json.loads(response_content)
-                papers = result.get('papers', [])
-                
-                if not papers:
-                    if 'papers' not in result and isinstance(result, list):
-                        papers = result
-                    logger.warning(f"논문 상세 정보가 0개입니다.")
-                
-                logger.info(f"{len(papers)}개의 논문 상세 정보 생성 완료")
-                return papers
-            except json.JSONDecodeError as e:
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_content, re.DOTALL)
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(1))
-                        papers = result.get('papers', [])
-                        logger.info(f"코드 블록에서 JSON 추출 성공: {len(papers)}개 논문")
-                        return papers
-                    except:
-                        pass
-                logger.error(f"JSON 파싱 오류: {e}")
-                logger.error(f"응답 내용: {response_content[:1000]}")
-                raise
-                
+            result = self._chat_json(
+                system="You are an expert in academic paper analysis. Add detailed information (arxiv_id, url, abstract) to the given paper list. You MUST respond with valid JSON format containing a 'papers' array.",
+                user=prompt,
+                max_tokens=3000,
+                reasoning_max_tokens=4000
+            )
+
+            papers = result.get('papers', []) if isinstance(result, dict) else []
+
+            if not papers:
+                if isinstance(result, list):
+                    papers = result
+                logger.warning(f"논문 상세 정보가 0개입니다.")
+
+            papers = _validate_papers(papers)
+            logger.info(f"{len(papers)}개의 논문 상세 정보 생성 완료")
+            return papers
+
         except Exception as e:
             logger.error(f"논문 상세 정보 생성 오류: {e}", exc_info=True)
             raise
@@ -335,9 +431,6 @@ class OpenAIClient:
         Returns:
             최신 논문 리스트
         """
-        import json
-        import re
-
         prompt = f"""당신은 AI/ML 논문 전문가입니다. 다음 분야의 최신 중요 논문 {count}개를 찾아주세요:
 
 검색 분야: {query}
@@ -364,41 +457,16 @@ class OpenAIClient:
 }}"""
 
         try:
-            completion_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in AI/ML research. Find real, recently published papers. Always respond with valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.7
-            }
-
-            if "gpt-4" in self.model.lower() or "gpt-3.5" in self.model.lower():
-                completion_params["response_format"] = {"type": "json_object"}
-
-            if "gpt-5" in self.model.lower() or "o1" in self.model.lower():
-                completion_params["max_completion_tokens"] = 4000
-            else:
-                completion_params["max_tokens"] = 3000
-
-            response = self.client.chat.completions.create(**completion_params)
-
-            if not response.choices or not response.choices[0].message:
-                return []
-
-            response_content = response.choices[0].message.content
+            result = self._chat_json(
+                system="You are an expert in AI/ML research. Find real, recently published papers. Always respond with valid JSON.",
+                user=prompt,
+                max_tokens=3000,
+                reasoning_max_tokens=4000
+            )
 
-            try:
-                result = json.loads(response_content)
-                papers = result.get('papers', [])
-                logger.info(f"분야별 최신 논문 {len(papers)}개 검색 완료")
-                return papers
-            except json.JSONDecodeError:
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_content, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group(1))
-                    return result.get('papers', [])
-                return []
+            papers = _validate_papers(result.get('papers', []) if isinstance(result, dict) else [])
+            logger.info(f"분야별 최신 논문 {len(papers)}개 검색 완료")
+            return papers
 
         except Exception as e:
             logger.error(f"분야별 최신 논문 검색 오류: {e}")
@@ -430,9 +498,10 @@ class OpenAIClient:
             # 제외할 논문 목록이 있으면 프롬프트에 추가
             exclude_text = ""
             if exclude_titles:
-                exclude_text = f"\n\n중요: 다음 논문들은 이미 수집되었으므로 제외하고 새로운 논문만 제시해주세요:\n"
-                for title in exclude_titles[:50]:  # 너무 많으면 처음 50개만
-                    exclude_text += f"- {title}\n"
+                exclude_text = (
+                    "\n\n중요: 다음 논문들은 이미 수집되었으므로 제외하고 새로운 논문만 제시해주세요:\n"
+                    + "".join(f"- {title}\n" for title in exclude_titles[:50])  # 너무 많으면 처음 50개만
+                )
             
             prompt = self._format_prompt(
                 prompt_template,
@@ -441,79 +510,29 @@ class OpenAIClient:
                 recent_years=recent_years
             ) + exclude_text
             
-            # gpt-5.2 같은 새 모델은 max_completion_tokens 사용
-            completion_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in academic paper analysis. Generate a comprehensive list of papers based on Google Scholar data. The list doesn't need to be perfectly accurate - include representative papers from the field. You MUST respond with valid JSON format containing a 'papers' array."},
-                    {"role": "user", "content": prompt}
-                ],
-                "temperature": 0.8
-            }
-            
-            # JSON 응답 형식 지원 (일부 모델만 지원)
-            # gpt-5.2는 response_format을 지원하지 않을 수 있으므로 프롬프트에서 강조
-            if "gpt-4" in self.model.lower() or "gpt-3.5" in self.model.lower():
-                completion_params["response_format"] = {"type": "json_object"}
-            
             # 모델에 따라 토큰 제한 설정 (10개 논문 기준으로 충분한 토큰)
-            if "gpt-5" in self.model.lower() or "o1" in self.model.lower():
-                completion_params["max_completion_tokens"] = 4000  # 10개 논문에 충분
-            else:
-                completion_params["max_tokens"] = 3000  # 10개 논문에 충분
-            
-            response = self.client.chat.completions.create(**completion_params)
-            
-            import json
-            import re
-            
-            # 응답 확인
-            if not response.choices or not response.choices[0].message:
-                raise ValueError("OpenAI API 응답에 choices가 없습니다.")
-            
-            response_content = response.choices[0].message.content
-            
-            if not response_content or not response_content.strip():
-                logger.error(f"OpenAI API 응답이 비어있습니다. 전체 응답: {response}")
-                raise ValueError("OpenAI API 응답이 비어있습니다.")
-            
-            logger.debug(f"OpenAI 응답 길이: {len(response_content)} bytes")
-            logger.debug(f"OpenAI 응답 시작 부분: {response_content[:200]}")
-            
-            try:
-                # JSON 파싱 시도
-                result = json.loads(response_content)
-                papers = result.get('papers', [])
-                
-                if not papers:
+            result = self._chat_json(
+                system="You are an expert in academic paper analysis. Generate a comprehensive list of papers based on Google Scholar data. The list doesn't need to be perfectly accurate - include representative papers from the field. You MUST respond with valid JSON format containing a 'papers' array.",
+                user=prompt,
+                max_tokens=3000,
+                reasoning_max_tokens=4000,
+                temperature=0.8
+            )
+
+            papers = result.get('papers', []) if isinstance(result, dict) else []
+
+            if not papers:
+                # papers 키가 없으면 전체를 papers로 시도
+                if isinstance(result, list):
+                    papers = result
+                    logger.info("응답이 배열 형식입니다. papers 배열로 사용합니다.")
+                elif isinstance(result, dict) and len(result) > 0:
+                    # 다른 키가 있을 수 있으므로 첫 번째 키 확인
                     logger.warning(f"논문이 0개입니다. 응답 구조 확인: {list(result.keys())}")
-                    logger.warning(f"응답 내용 일부: {response_content[:1000]}")
-                    # papers 키가 없으면 전체를 papers로 시도
-                    if 'papers' not in result and isinstance(result, list):
-                        papers = result
-                        logger.info("응답이 배열 형식입니다. papers 배열로 사용합니다.")
-                    elif isinstance(result, dict) and len(result) > 0:
-                        # 다른 키가 있을 수 있으므로 첫 번째 키 확인
-                        first_key = list(result.keys())[0]
-                        logger.warning(f"응답의 첫 번째 키: {first_key}")
-                
-                logger.info(f"{len(papers)}개의 논문 리스트 생성 완료")
-                return papers
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON 파싱 오류: {e}")
-                logger.error(f"응답 내용 처음 2000자: {response_content[:2000]}")
-                # 마크다운 코드 블록에서 JSON 추출 시도
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_content, re.DOTALL)
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(1))
-                        papers = result.get('papers', [])
-                        logger.info(f"코드 블록에서 JSON 추출 성공: {len(papers)}개 논문")
-                        return papers
-                    except:
-                        pass
-                raise
-            
+
+            logger.info(f"{len(papers)}개의 논문 리스트 생성 완료")
+            return papers
+
         except Exception as e:
             logger.error(f"논문 리스트 생성 오류: {e}", exc_info=True)
             raise
@@ -583,10 +602,8 @@ class OpenAIClient:
                 "temperature": 0.8
             }
             
-            if "gpt-5" in review_model.lower() or "o1" in review_model.lower():
-                completion_params["max_completion_tokens"] = 8000
-            else:
-                completion_params["max_tokens"] = 4000
+            review_caps = _capabilities_for(review_model)
+            completion_params[review_caps.token_param_name] = 8000 if review_caps.is_reasoning_model else 4000
             
             response = self.client.chat.completions.create(**completion_params)
             
@@ -1,14 +1,30 @@
 """
 논문 리뷰 콘텐츠 생성기 (Claude 활용)
 """
+import asyncio
 import logging
-from typing import Dict, Optional, TYPE_CHECKING
+import os
+import random
+import time
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..client.claude_client import ClaudeClient
 
 logger = logging.getLogger(__name__)
 
+
+def _is_retryable_error(error_msg: str) -> bool:
+    """잠시 후 재시도하면 성공할 수 있는 에러인지 판별 (rate limit / 과부하)"""
+    lowered = error_msg.lower()
+    return "rate" in lowered or "429" in error_msg or "overloaded" in lowered or "503" in error_msg
+
+
+def _retry_wait_seconds(attempt: int) -> float:
+    """재시도 대기 시간 (지수 백오프, 최대 30초)"""
+    return min(2 ** attempt, 30)
+
+
 # 논문 리뷰 템플릿들 (Claude 사용 불가 시 fallback)
 REVIEW_TEMPLATES = [
     """# 논문 제목 분석
@@ -127,6 +143,9 @@ AI 분야의 지속적인 발전을 보여주는 의미 있는 연구라고 평
 *AI 논문 리뷰 포스트입니다.*"""
 ]
 
+# 개인화 치환을 매번 template.replace로 하지 않도록 '[주요 기여]' 기준으로 미리 분할
+_TEMPLATE_PARTS = [t.partition('[주요 기여]') for t in REVIEW_TEMPLATES]
+
 
 def generate_paper_review_content(
     paper: Dict,
@@ -134,7 +153,9 @@ def generate_paper_review_content(
     review_number: Optional[int] = None,
     review_model: Optional[str] = None,
     use_scientific_skills: bool = False,
-    scientific_style: str = "peer-review"
+    scientific_style: str = "peer-review",
+    cache_system: bool = True,
+    max_retries: int = 3
 ) -> str:
     """
     논문 리뷰 콘텐츠 생성
@@ -146,37 +167,189 @@ def generate_paper_review_content(
         review_model: 리뷰 작성용 모델 (None이면 클라이언트 기본 모델 사용)
         use_scientific_skills: Scientific Skills 스타일 사용 여부
         scientific_style: Scientific Skills 스타일 (peer-review, literature-review 등)
+        cache_system: 고정 시스템 프롬프트에 Anthropic 프롬프트 캐싱 적용 여부
+        max_retries: rate limit/과부하 에러 시 최대 재시도 횟수
 
     Returns:
         생성된 리뷰 콘텐츠 (마크다운)
     """
     # Claude 클라이언트가 있으면 사용
     if claude_client:
-        try:
-            review = claude_client.generate_paper_review(
-                paper,
-                language="ko",
-                model=review_model,
-                use_scientific_skills=use_scientific_skills,
-                scientific_style=scientific_style
-            )
-            return review
-        except Exception as e:
-            # rate limit 등 예상 가능한 에러는 경고 레벨, 기타 에러는 에러 레벨
-            error_msg = str(e)
-            if "rate" in error_msg.lower() or "429" in error_msg or "overloaded" in error_msg.lower():
-                logger.warning(f"Claude API 할당량 초과, 템플릿 사용: {type(e).__name__}")
-            else:
-                logger.error(f"Claude 리뷰 생성 실패, 템플릿 사용: {type(e).__name__}: {error_msg[:100]}")
+        for attempt in range(max_retries + 1):
+            try:
+                review = claude_client.generate_paper_review(
+                    paper,
+                    language="ko",
+                    model=review_model,
+                    use_scientific_skills=use_scientific_skills,
+                    scientific_style=scientific_style,
+                    cache_system=cache_system
+                )
+                return review
+            except Exception as e:
+                # rate limit 등 예상 가능한 에러는 경고 레벨, 기타 에러는 에러 레벨
+                error_msg = str(e)
+                if _is_retryable_error(error_msg):
+                    if attempt < max_retries:
+                        wait = _retry_wait_seconds(attempt)
+                        logger.warning(f"Claude API 할당량 초과, {wait}초 후 재시도 ({attempt + 1}/{max_retries}): {type(e).__name__}")
+                        time.sleep(wait)
+                        continue
+                    logger.warning(f"Claude API 할당량 초과, 템플릿 사용: {type(e).__name__}")
+                else:
+                    logger.error(f"Claude 리뷰 생성 실패, 템플릿 사용: {type(e).__name__}: {error_msg[:100]}")
+                break
     
     # 템플릿 사용 (fallback)
-    import random
-    template = random.choice(REVIEW_TEMPLATES)
-    
-    # 논문 정보로 템플릿 개인화
+    left, sep, right = random.choice(_TEMPLATE_PARTS)
+
+    # 논문 정보로 템플릿 개인화 ([주요 기여] 치환 + 헤더를 한 번의 조립으로 처리)
     if paper:
-        template = template.replace('[주요 기여]', paper.get('title', '이 논문'))
-        template = f"# {paper.get('title', '논문 리뷰')}\n\n**저자**: {', '.join(paper.get('authors', []))}\n**발행년도**: {paper.get('year', 'N/A')}\n**인용수**: {paper.get('citations', 'N/A')}\n\n---\n\n{template}"
-    
-    return template
+        title = paper.get('title', '이 논문')
+        return (
+            f"# {paper.get('title', '논문 리뷰')}\n\n"
+            f"**저자**: {', '.join(paper.get('authors', []))}\n"
+            f"**발행년도**: {paper.get('year', 'N/A')}\n"
+            f"**인용수**: {paper.get('citations', 'N/A')}\n\n"
+            f"---\n\n{left}{title if sep else ''}{right}"
+        )
+
+    return left + sep + right
+
+
+def generate_paper_reviews_batch(
+    papers: List[Dict],
+    claude_client: Optional["ClaudeClient"] = None,
+    review_model: Optional[str] = None,
+    batch_size: int = 5,
+    cache_system: bool = True
+) -> List[str]:
+    """
+    여러 논문의 리뷰 콘텐츠를 일괄 생성
+
+    batch_size개씩 묶어 Claude API를 한 번만 호출하므로 논문당 왕복
+    지연이 크게 줄어듭니다. 일괄 호출이 실패한 묶음은 논문별 개별
+    생성(generate_paper_review_content)으로 폴백합니다.
+
+    Args:
+        papers: 논문 정보 리스트
+        claude_client: Claude 클라이언트 (None이면 템플릿 사용)
+        review_model: 리뷰 작성용 모델 (None이면 클라이언트 기본 모델 사용)
+        batch_size: 한 번의 API 호출에 묶을 논문 수
+        cache_system: 고정 시스템 프롬프트에 Anthropic 프롬프트 캐싱 적용 여부
+
+    Returns:
+        논문 순서와 동일한 리뷰 콘텐츠(마크다운) 리스트
+    """
+    reviews: List[str] = []
+
+    for start in range(0, len(papers), batch_size):
+        batch = papers[start:start + batch_size]
+
+        if claude_client and len(batch) > 1:
+            try:
+                reviews.extend(claude_client.generate_paper_reviews_batch(
+                    batch,
+                    language="ko",
+                    model=review_model,
+                    cache_system=cache_system
+                ))
+                continue
+            except Exception as e:
+                logger.warning(f"일괄 리뷰 생성 실패, 개별 생성으로 전환: {type(e).__name__}")
+
+        # 일괄 호출 실패 또는 클라이언트 없음: 논문별 개별 생성
+        for paper in batch:
+            reviews.append(generate_paper_review_content(
+                paper,
+                claude_client=claude_client,
+                review_model=review_model,
+                cache_system=cache_system
+            ))
+
+    return reviews
 
+
+async def generate_paper_review_content_async(
+    paper: Dict,
+    claude_client: Optional["ClaudeClient"] = None,
+    review_model: Optional[str] = None,
+    use_scientific_skills: bool = False,
+    scientific_style: str = "peer-review",
+    cache_system: bool = True,
+    max_retries: int = 3
+) -> str:
+    """
+    논문 리뷰 콘텐츠 생성 (비동기)
+
+    인자와 폴백 동작은 generate_paper_review_content와 동일하며,
+    Claude 호출만 워커 스레드로 넘겨 이벤트 루프를 막지 않습니다.
+    """
+    if claude_client:
+        for attempt in range(max_retries + 1):
+            try:
+                return await claude_client.generate_paper_review_async(
+                    paper,
+                    language="ko",
+                    model=review_model,
+                    use_scientific_skills=use_scientific_skills,
+                    scientific_style=scientific_style,
+                    cache_system=cache_system
+                )
+            except Exception as e:
+                error_msg = str(e)
+                if _is_retryable_error(error_msg):
+                    if attempt < max_retries:
+                        wait = _retry_wait_seconds(attempt)
+                        logger.warning(f"Claude API 할당량 초과, {wait}초 후 재시도 ({attempt + 1}/{max_retries}): {type(e).__name__}")
+                        await asyncio.sleep(wait)
+                        continue
+                    logger.warning(f"Claude API 할당량 초과, 템플릿 사용: {type(e).__name__}")
+                else:
+                    logger.error(f"Claude 리뷰 생성 실패, 템플릿 사용: {type(e).__name__}: {error_msg[:100]}")
+                break
+
+    # 템플릿 폴백은 동기 경로와 동일 (claude_client=None으로 호출)
+    return generate_paper_review_content(paper, claude_client=None)
+
+
+async def generate_paper_reviews_concurrent(
+    papers: List[Dict],
+    claude_client: Optional["ClaudeClient"] = None,
+    review_model: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    cache_system: bool = True
+) -> List[str]:
+    """
+    여러 논문의 리뷰를 동시에 생성
+
+    논문별 호출은 서로 독립적이므로 asyncio.Semaphore로 동시 호출 수를
+    제한하며 asyncio.gather로 병렬 실행합니다. N개 논문의 전체 지연이
+    호출 시간의 합이 아니라 최대값 수준으로 줄어듭니다.
+
+    Args:
+        papers: 논문 정보 리스트
+        claude_client: Claude 클라이언트 (None이면 템플릿 사용)
+        review_model: 리뷰 작성용 모델 (None이면 클라이언트 기본 모델 사용)
+        concurrency: 최대 동시 호출 수 (None이면 CLAUDE_CONCURRENCY 환경변수, 기본 5)
+        cache_system: 고정 시스템 프롬프트에 Anthropic 프롬프트 캐싱 적용 여부
+
+    Returns:
+        논문 순서와 동일한 리뷰 콘텐츠(마크다운) 리스트
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv('CLAUDE_CONCURRENCY', 5))
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def bound(paper: Dict) -> str:
+        async with sem:
+            return await generate_paper_review_content_async(
+                paper,
+                claude_client=claude_client,
+                review_model=review_model,
+                cache_system=cache_system
+            )
+
+    return list(await asyncio.gather(*[bound(p) for p in papers]))
+    
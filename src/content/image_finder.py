@@ -4,17 +4,29 @@
 - PDF 다운로드 후 이미지 추출
 - 구글 이미지 검색
 """
+import asyncio
+import heapq
+import io
+import json
 import logging
 import requests
 import re
+import shutil
 import time
 import os
 import tempfile
+import threading
 import hashlib
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Set
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, quote_plus, urljoin
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +38,105 @@ except ImportError:
     PYMUPDF_AVAILABLE = False
     logger.debug("pymupdf not available - PDF image extraction disabled")
 
+# HTML 파싱용 lxml (선택적) - C 확장이라 html.parser보다 수 배 빠름
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+    logger.debug("lxml not available - falling back to html.parser")
+
+# 호출마다 재생성하지 않도록 모듈 로드 시 한 번만 컴파일/구성하는 상수들
+_TITLE_WORD_RE = re.compile(r'\b[A-Za-z]+\b')
+_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})(v\d+)?')
+_ABBREV_RE = re.compile(r'\(([A-Za-z0-9\-]+)\)')
+_IMG_URL_RE = re.compile(r'"(https?://[^"]+\.(?:jpg|jpeg|png|webp))"', re.I)
+_SAFE_TITLE_RE = re.compile(r'[^\w\-_]')
+
+# arXiv API Atom 피드 네임스페이스
+_ATOM_NS = {'a': 'http://www.w3.org/2005/Atom'}
+
+# 이미지 URL 유효성: 상대 images/ 경로 또는 http(s) 스킴+호스트 (urlparse 호출 대체)
+_VALID_URL_RE = re.compile(r'^(?:images/|https?://[^/\s]+)')
+_LTX_GRAPHICS_RE = re.compile(r'ltx_graphics|figure', re.I)
+_PAPER_CARD_RE = re.compile(r'paper-card|entity|row', re.I)
+
+# 필요한 태그만 파싱하는 SoupStrainer (전체 DOM 생성 비용 절감)
+_META_IMG_STRAINER = SoupStrainer(['meta', 'img'])
+_CARD_IMG_STRAINER = SoupStrainer(['div', 'img'])
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
+    'from', 'as', 'into', 'through', 'during', 'before', 'after',
+    'above', 'below', 'between', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
+    'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
+    'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
+    'and', 'but', 'if', 'or', 'because', 'until', 'while', 'although',
+    'you', 'your', 'yours', 'yourself', 'yourselves', 'we', 'our', 'ours'
+})
+
+# 캡션/alt 텍스트로 이미지 유형을 판단하는 패턴 (C 레벨 단일 스캔, re.I로 lower() 불필요)
+_ARCH_CAPTION_RE = re.compile(r'architecture|overview|framework|model|structure|network', re.I)
+_EXP_CAPTION_RE = re.compile(r'result|experiment|comparison|performance|accuracy|table', re.I)
+_ALT_TEXT_RE = re.compile(r'architecture|diagram|figure|model|network', re.I)
+
+# 리뷰 본문에서 이미지 삽입 위치를 찾을 때 쓰는 섹션 제목 패턴 (re.I로 lower() 호출 불필요)
+_METHOD_SECTION_RE = re.compile(r'방법|해결|아키텍처|구조|method|approach|architecture|key idea|핵심', re.I)
+_RESULT_SECTION_RE = re.compile(r'실험|결과|experiment|result|evaluation|평가', re.I)
+
+
+class _TokenBucket:
+    """
+    스레드 안전 토큰 버킷 레이트 리미터
+
+    고정 time.sleep 딜레이는 서버 한도와 무관하게 처리량을 묶어버리므로,
+    초당 rate개의 토큰을 채우는 버킷으로 실제 요청 속도만 제한함.
+    동시 요청(스레드 풀/asyncio.to_thread)에서도 안전함.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰이 생길 때까지 대기 후 하나 소비"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class ImageFinder:
     """논문 아키텍처/구조 이미지 찾기 (개선 버전)"""
 
-    def __init__(self, google_api_key: Optional[str] = None, google_cx: Optional[str] = None, output_dir: Optional[str] = None):
+    def __init__(
+        self,
+        google_api_key: Optional[str] = None,
+        google_cx: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        cache_ttl: int = 7 * 24 * 3600,
+        session: Optional[requests.Session] = None
+    ):
         """
         Args:
             google_api_key: Google Custom Search API 키 (선택)
             google_cx: Google Custom Search Engine ID (선택)
             output_dir: 이미지 저장 디렉토리 (기본값: output/images)
+            cache_ttl: 이미지 검색 결과 디스크 캐시 유효 시간 (초, 기본 7일)
+            session: 주입할 requests.Session (None이면 풀링된 세션을 직접 생성)
         """
         self.google_api_key = google_api_key
         self.google_cx = google_cx
@@ -47,24 +148,140 @@ class ImageFinder:
             self.IMAGE_DIR = Path("output") / "images"
         self.IMAGE_DIR.mkdir(parents=True, exist_ok=True)
 
+        # 검색 결과 디스크 캐시 (같은 논문 재처리 시 네트워크/API 비용 절약)
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(".cache") / "images"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # 공유 세션: keep-alive 연결 재사용으로 요청마다 TCP+TLS 핸드셰이크 비용 제거
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            # 개별 요청에서 headers를 넘기지 않아도 되도록 기본 User-Agent 설정
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+
+        # HEAD 검증 결과 캐시 (같은 실행 내 중복 HEAD 요청 방지)
+        self._head_cache: Dict[str, bool] = {}
+
+        # 페이지 HTML 캐시 (한 논문 처리 중 같은 페이지를 두 번 받지 않도록)
+        self._page_cache: Dict[str, str] = {}
+
+        # 페이지 HTML 디스크 캐시 (arXiv는 기껏해야 하루 단위 갱신이라 24시간 TTL)
+        self.page_cache_ttl = 86400
+        self.page_cache_dir = Path(".cache") / "pages"
+        self.page_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # 제목→arxiv_id 매핑 영구 캐시 (같은 논문 재처리 시 arXiv 검색 왕복 생략)
+        self._title_cache_path = Path(".cache") / "title_to_arxiv.json"
+        self._title_cache: Dict[str, str] = {}
+        try:
+            if self._title_cache_path.exists():
+                self._title_cache = json.loads(self._title_cache_path.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.debug(f"제목 캐시 로드 실패: {e}")
+            self._title_cache = {}
+
+        # 논문별 이미지 디렉터리 캐시 (재호출 시 mkdir/stat 시스템콜 생략)
+        self._dir_cache: Dict[str, Path] = {}
+
+        # 디스크 쓰기 전용 풀 (추출/스코어링 CPU 작업과 파일 쓰기를 겹침)
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+
+        # 호스트별 레이트 리미터 (고정 sleep 대신 실제 한도 기준으로 속도 제한)
+        self._google_rl = _TokenBucket(rate=10)  # Google CSE: 100 qps 한도 대비 보수적으로 10 qps
+        self._arxiv_rl = _TokenBucket(rate=3)    # arXiv API: 정중한 사용을 위해 3 qps
+        self._scrape_rl = _TokenBucket(rate=2)   # www.google.com 스크래핑: 차단 방지용 2 qps
+
+    def close(self):
+        """직접 생성한 세션의 연결 풀과 쓰기 풀 정리 (주입받은 세션은 호출자 소유)"""
+        self._io_pool.shutdown(wait=True)
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _cache_path(self, key: str) -> Path:
+        """캐시 키를 파일 경로로 변환"""
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _cache_get(self, key: str) -> Optional[List[Dict]]:
+        """디스크 캐시 조회 (TTL 초과/손상 시 None)"""
+        path = self._cache_path(key)
+        try:
+            if path.exists() and (time.time() - path.stat().st_mtime) < self.cache_ttl:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.debug(f"이미지 캐시 읽기 실패: {e}")
+        return None
+
+    def _cache_set(self, key: str, value: List[Dict]):
+        """디스크 캐시 저장 (실패해도 검색 결과에는 영향 없음)"""
+        try:
+            with open(self._cache_path(key), 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+        except Exception as e:
+            logger.debug(f"이미지 캐시 쓰기 실패: {e}")
+
+    def _paper_dir(self, paper: Dict) -> Path:
+        """논문별 이미지 디렉터리 (경로 계산과 mkdir는 논문당 한 번만)"""
+        pid = paper.get('arxiv_id') or paper.get('title', '')[:50]
+        cached = self._dir_cache.get(pid)
+        if cached is not None:
+            return cached
+
+        safe_title = _SAFE_TITLE_RE.sub('_', paper.get('title', 'paper'))[:50]
+        paper_dir = self.IMAGE_DIR / safe_title
+        paper_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_cache[pid] = paper_dir
+        return paper_dir
+
+    @staticmethod
+    def _paper_cache_key(paper: Dict) -> Optional[str]:
+        """논문 식별 캐시 키 (arxiv_id > url > title 순)"""
+        ident = paper.get('arxiv_id') or paper.get('url') or paper.get('title')
+        return f"images:{ident}" if ident else None
+
+    def _save_title_cache(self):
+        """제목→arxiv_id 캐시를 디스크에 저장"""
+        try:
+            self._title_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._title_cache_path.write_text(
+                json.dumps(self._title_cache, ensure_ascii=False), encoding='utf-8'
+            )
+        except Exception as e:
+            logger.debug(f"제목 캐시 저장 실패: {e}")
+
     def _search_arxiv_by_title(self, title: str) -> Optional[str]:
         """논문 제목으로 arXiv에서 arxiv_id 검색"""
+        # 영구 캐시 히트 시 arXiv 왕복 전체 생략
+        cache_key = hashlib.sha256(title.encode('utf-8')).hexdigest()
+        cached = self._title_cache.get(cache_key)
+        if cached:
+            return cached
+
         try:
             # 제목에서 핵심 키워드 추출 (짧은 단어, 불용어 제외)
-            stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                         'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                         'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-                         'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
-                         'from', 'as', 'into', 'through', 'during', 'before', 'after',
-                         'above', 'below', 'between', 'under', 'again', 'further', 'then',
-                         'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all',
-                         'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
-                         'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 'just',
-                         'and', 'but', 'if', 'or', 'because', 'until', 'while', 'although',
-                         'you', 'your', 'yours', 'yourself', 'yourselves', 'we', 'our', 'ours'}
-
-            words = re.findall(r'\b[A-Za-z]+\b', title)
-            keywords = [w for w in words if w.lower() not in stop_words and len(w) > 2][:5]
+            words = _TITLE_WORD_RE.findall(title)
+            keywords = [w for w in words if w.lower() not in _STOP_WORDS and len(w) > 2][:5]
 
             # 여러 검색 쿼리 시도
             queries = [
@@ -74,43 +291,153 @@ class ImageFinder:
 
             headers = {'User-Agent': 'Mozilla/5.0'}
 
+            # 제목 단어 집합은 entry마다 동일하므로 루프 밖에서 한 번만 계산
+            title_lower = title.lower()
+            title_words = frozenset(title_lower.split()) - _STOP_WORDS
+            title_prefix = title_lower[:20]
+
             for query in queries:
                 search_query = quote_plus(query)
                 url = f"http://export.arxiv.org/api/query?search_query={search_query}&start=0&max_results=5"
 
-                response = requests.get(url, timeout=15, headers=headers)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'xml')
-                    entries = soup.find_all('entry')
+                atom_xml = self._fetch_page(url, headers, timeout=15, limiter=self._arxiv_rl)
+                if atom_xml is not None:
+                    # 작고 정형화된 Atom XML이라 BeautifulSoup 없이
+                    # ElementTree로 직접 파싱 (트리 구축/탐색 오버헤드 제거)
+                    try:
+                        root = ET.fromstring(atom_xml)
+                    except ET.ParseError as e:
+                        logger.debug(f"arXiv Atom 파싱 실패: {e}")
+                        continue
 
-                    for entry in entries:
-                        entry_title = entry.find('title')
-                        if entry_title:
-                            entry_title_text = entry_title.get_text(strip=True).lower().replace('\n', ' ')
-                            title_lower = title.lower()
+                    for entry in root.iterfind('a:entry', _ATOM_NS):
+                        title_el = entry.find('a:title', _ATOM_NS)
+                        if title_el is not None and title_el.text:
+                            entry_title_text = ' '.join(title_el.text.split()).lower()
 
                             # 제목 유사도 확인 (더 유연하게)
-                            title_words = set(title_lower.split())
                             entry_words = set(entry_title_text.split())
-                            common_words = title_words & entry_words - stop_words
 
                             # 공통 단어가 3개 이상이거나, 제목의 핵심 부분이 포함되면 매칭
-                            if len(common_words) >= 3 or title_lower[:20] in entry_title_text:
-                                id_elem = entry.find('id')
-                                if id_elem:
-                                    arxiv_url = id_elem.get_text(strip=True)
-                                    match = re.search(r'(\d{4}\.\d{4,5})(v\d+)?', arxiv_url)
+                            if len(title_words & entry_words) >= 3 or title_prefix in entry_title_text:
+                                id_el = entry.find('a:id', _ATOM_NS)
+                                if id_el is not None and id_el.text:
+                                    match = _ARXIV_ID_RE.search(id_el.text)
                                     if match:
                                         arxiv_id = match.group(1)
                                         logger.info(f"arXiv ID 발견: {arxiv_id} (제목: {entry_title_text[:40]}...)")
+                                        self._title_cache[cache_key] = arxiv_id
+                                        self._save_title_cache()
                                         return arxiv_id
 
-                time.sleep(0.3)  # API 요청 간 딜레이
-
         except Exception as e:
             logger.debug(f"arXiv 검색 실패: {e}")
         return None
 
+    def _page_cache_path(self, url: str) -> Path:
+        """페이지 캐시 파일 경로 (URL md5 기준)"""
+        digest = hashlib.md5(url.encode('utf-8')).hexdigest()
+        return self.page_cache_dir / f"{digest}.html"
+
+    def _fetch_page(self, url: str, headers: Dict, timeout: int = 15, limiter: Optional[_TokenBucket] = None) -> Optional[str]:
+        """
+        페이지 HTML 조회 (메모리 + 디스크 캐시 적용)
+
+        같은 논문을 처리하는 동안 arXiv abs 페이지처럼 여러 추출기가
+        같은 URL을 요청할 수 있어, 성공한 응답 본문을 메모리에 캐시함.
+        arXiv/ar5iv 페이지는 하루 단위로나 갱신되므로 24시간 TTL의
+        디스크 캐시도 두어 재실행/배치 워크플로우의 반복 다운로드와
+        재파싱 비용을 없앰.
+        """
+        if url in self._page_cache:
+            return self._page_cache[url]
+
+        # 디스크 캐시 (24시간 TTL)
+        disk_path = self._page_cache_path(url)
+        try:
+            if disk_path.exists() and (time.time() - disk_path.stat().st_mtime) < self.page_cache_ttl:
+                text = disk_path.read_text(encoding='utf-8')
+                self._page_cache[url] = text
+                return text
+        except Exception as e:
+            logger.debug(f"페이지 캐시 읽기 실패: {e}")
+
+        if limiter is not None:
+            limiter.acquire()  # 캐시 미스로 실제 요청을 보낼 때만 속도 제한
+        response = self._session.get(url, timeout=timeout, headers=headers, allow_redirects=True)
+        if response.status_code != 200:
+            return None
+
+        # 무한히 쌓이지 않도록 단순 상한 (대량 배치 실행 대비)
+        if len(self._page_cache) >= 64:
+            self._page_cache.clear()
+        self._page_cache[url] = response.text
+
+        try:
+            disk_path.write_text(response.text, encoding='utf-8')
+        except Exception as e:
+            logger.debug(f"페이지 캐시 쓰기 실패: {e}")
+
+        return response.text
+
+    def _head_check_image(self, url: str) -> bool:
+        """
+        HEAD 요청으로 이미지 URL 도달 가능 여부 확인 (3초 타임아웃)
+
+        로컬 상대 경로(images/...)는 네트워크 확인 없이 통과.
+        HEAD를 거부하는 호스트(405)는 판단 불가이므로 통과시킴.
+        """
+        if url.startswith('images/'):
+            return True
+        if url in self._head_cache:
+            return self._head_cache[url]
+
+        ok = False
+        try:
+            response = self._session.head(url, timeout=3, allow_redirects=True)
+            if response.status_code == 405:
+                ok = True  # HEAD 미지원 호스트 - 확인 불가, 유지
+            elif response.status_code < 400:
+                content_type = response.headers.get('content-type', '')
+                # content-type이 명시적으로 이미지가 아닌 경우만 제외
+                ok = not content_type or content_type.startswith(('image/', 'application/octet-stream'))
+        except Exception as e:
+            logger.debug(f"이미지 HEAD 검증 실패 ({url[:60]}): {e}")
+
+        self._head_cache[url] = ok
+        return ok
+
+    async def _validate_image_urls(self, urls: List[str]) -> Set[str]:
+        """후보 URL들을 동시에 HEAD 검증, 도달 가능한 URL 집합 반환"""
+        if not urls:
+            return set()
+        results = await asyncio.gather(
+            *[asyncio.to_thread(self._head_check_image, url) for url in urls]
+        )
+        return {url for url, ok in zip(urls, results) if ok}
+
+    def _finalize(self, images: List[Dict], cache_key: Optional[str], max_images: int) -> List[Dict]:
+        """
+        수집된 이미지들을 HEAD로 일괄 검증 후 캐시에 저장하고 반환
+
+        개별 순차 HEAD 대신 asyncio.gather로 동시에 확인하므로 전체
+        검증 지연은 URL 수와 무관하게 가장 느린 응답 하나 수준임.
+        """
+        if images:
+            try:
+                reachable = asyncio.run(self._validate_image_urls([img['url'] for img in images]))
+                dropped = len(images) - sum(1 for img in images if img['url'] in reachable)
+                if dropped:
+                    logger.info(f"도달 불가 이미지 URL {dropped}개 제외")
+                images = [img for img in images if img['url'] in reachable]
+            except RuntimeError:
+                # 이미 실행 중인 이벤트 루프 안에서는 순차 검증으로 폴백
+                images = [img for img in images if self._head_check_image(img['url'])]
+
+        if cache_key:
+            self._cache_set(cache_key, images[:max_images])
+        return images[:max_images]
+
     def find_images_for_paper(
         self,
         paper: Dict,
@@ -128,11 +455,19 @@ class ImageFinder:
         Returns:
             이미지 정보 리스트 [{"url": "...", "title": "...", "source": "...", "type": "..."}]
         """
+        # 디스크 캐시 확인 (재처리/재시도 시 전체 네트워크 경로 생략)
+        cache_key = self._paper_cache_key(paper)
+        if cache_key:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"이미지 캐시 적중: {paper.get('title', '')[:50]}... ({len(cached)}개)")
+                return cached[:max_images]
+
         images = []
         seen_urls: Set[str] = set()
 
         title = paper.get('title', '')
-        arxiv_id = paper.get('arxiv_id')
+        arxiv_id = _normalize_arxiv_id(paper.get('arxiv_id') or '') or None
 
         # arxiv_id가 없으면 제목으로 검색
         if not arxiv_id and title:
@@ -142,96 +477,163 @@ class ImageFinder:
 
         logger.info(f"이미지 검색 시작: {title[:50]}... (arxiv_id: {arxiv_id})")
 
-        # 1. ar5iv (arXiv HTML 버전)에서 Figure 추출 (최우선 - 가장 고품질)
-        if arxiv_id:
-            ar5iv_images = self._extract_ar5iv_figures(paper)
-            for img in ar5iv_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
-                    images.append(img)
-                    logger.info(f"  → ar5iv Figure 발견: {img.get('title', '')[:40]}...")
-                    if len(images) >= max_images:
-                        return images[:max_images]
-
-        # 2. arXiv PDF에서 이미지 추출 (Figure 1, 2 등)
-        if len(images) < min_images and arxiv_id and PYMUPDF_AVAILABLE:
-            pdf_images = self._extract_pdf_images(paper, max_images=3)
-            for img in pdf_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
-                    images.append(img)
-                    logger.info(f"  → PDF Figure 추출: {img.get('title', '')[:40]}...")
-                    if len(images) >= max_images:
-                        return images[:max_images]
-
-        # 3. Papers with Code에서 이미지 찾기
-        if len(images) < min_images:
-            pw_code_images = self._extract_paperswithcode_images(paper)
-            for img in pw_code_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
-                    images.append(img)
-                    logger.info(f"  → Papers with Code 이미지: {img.get('title', '')[:40]}...")
-                    if len(images) >= max_images:
-                        return images[:max_images]
-
-        # 4. Google Custom Search로 이미지 검색 (API 키가 있는 경우)
-        if len(images) < min_images and self.google_api_key and self.google_cx:
-            # 아키텍처 이미지 검색
-            search_images = self._search_google_images_enhanced(paper, max_images - len(images), 'architecture')
-            for img in search_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
+        def collect(found, label: str) -> bool:
+            """중복/무효 URL을 거르며 수집, max_images 도달 시 True"""
+            for img in found:
+                key = _canonical_url(img['url'])
+                if key not in seen_urls and self._validate_image_url(img['url']):
+                    seen_urls.add(key)
                     images.append(img)
-                    logger.info(f"  → Google 아키텍처 이미지: {img.get('title', '')[:40]}...")
+                    logger.info(f"  → {label}: {img.get('title', '')[:40]}...")
                     if len(images) >= max_images:
-                        return images[:max_images]
+                        return True
+            return False
 
-            # 실험 결과 이미지 검색
+        def google_cse_images():
+            # 아키텍처 이미지 우선, 여유가 남으면 실험 결과 이미지까지
+            yield from self._search_google_images_enhanced(paper, max_images - len(images), 'architecture')
             if len(images) < max_images:
-                exp_images = self._search_google_images_enhanced(paper, max_images - len(images), 'experiment')
-                for img in exp_images:
-                    if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                        seen_urls.add(img['url'])
-                        images.append(img)
-                        logger.info(f"  → Google 실험결과 이미지: {img.get('title', '')[:40]}...")
-                        if len(images) >= max_images:
-                            return images[:max_images]
-
-        # 5. Google 이미지 스크래핑 (API 키 없이)
-        if len(images) < min_images:
-            scrape_images = self._scrape_google_images(paper, max_images - len(images))
-            for img in scrape_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
-                    images.append(img)
-                    logger.info(f"  → Google 스크래핑 이미지: {img.get('title', '')[:40]}...")
-                    if len(images) >= max_images:
-                        return images[:max_images]
-
-        # 6. arXiv abs 페이지에서 OG 이미지 등 추출
-        if len(images) < min_images and arxiv_id:
-            arxiv_images = self._extract_arxiv_images(paper)
-            for img in arxiv_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
-                    images.append(img)
-                    if len(images) >= max_images:
-                        return images[:max_images]
-
-        # 7. 논문 URL에서 직접 이미지 추출
-        if len(images) < min_images and paper.get('url'):
-            direct_images = self._extract_direct_url_images(paper)
-            for img in direct_images:
-                if img['url'] not in seen_urls and self._validate_image_url(img['url']):
-                    seen_urls.add(img['url'])
+                yield from self._search_google_images_enhanced(paper, max_images - len(images), 'experiment')
+
+        # 1. ar5iv (arXiv HTML 버전)에서 Figure 추출 (최우선 - 가장 고품질)
+        if arxiv_id and collect(self._extract_ar5iv_figures(paper), 'ar5iv Figure 발견'):
+            return self._finalize(images, cache_key, max_images)
+
+        # 2-7. 이후 소스들은 min_images를 채울 때까지만 순서대로 시도
+        # (min==max인 흔한 경우 첫 소스 성공 시 나머지 단계 조건 평가도 생략)
+        stages = (
+            (bool(arxiv_id) and PYMUPDF_AVAILABLE,
+             lambda: self._extract_pdf_images(paper, max_images=3), 'PDF Figure 추출'),
+            (True, lambda: self._extract_paperswithcode_images(paper), 'Papers with Code 이미지'),
+            (bool(self.google_api_key and self.google_cx), google_cse_images, 'Google 이미지'),
+            (True, lambda: self._scrape_google_images(paper, max_images - len(images)), 'Google 스크래핑 이미지'),
+            (bool(arxiv_id), lambda: self._extract_arxiv_images(paper), 'arXiv 페이지 이미지'),
+            (bool(paper.get('url')), lambda: self._extract_direct_url_images(paper), '논문 URL 이미지'),
+        )
+        for enabled, fetch, label in stages:
+            if len(images) >= min_images:
+                break
+            if enabled and collect(fetch(), label):
+                break
+
+        logger.info(f"이미지 검색 완료: {len(images)}개 발견")
+        return self._finalize(images, cache_key, max_images)
+
+    async def find_images_for_paper_async(
+        self,
+        paper: Dict,
+        min_images: int = 1,
+        max_images: int = 5
+    ) -> List[Dict]:
+        """
+        find_images_for_paper의 비동기 버전 - 모든 소스를 동시에 조회
+
+        기존 동기 버전은 소스를 순차적으로 조회하여 논문 하나에 수십 초가
+        걸릴 수 있음. 여기서는 각 소스 조회를 스레드로 보내 동시에 실행하고
+        (HTML 파싱도 워커 스레드에서 수행되어 이벤트 루프를 막지 않음),
+        결과는 기존과 동일한 소스 우선순위로 병합/중복 제거함.
+
+        Args:
+            paper: 논문 정보 (title, arxiv_id, url 등)
+            min_images: 최소 이미지 개수 (기본값: 1)
+            max_images: 최대 이미지 개수 (기본값: 5)
+
+        Returns:
+            이미지 정보 리스트 [{"url": "...", "title": "...", "source": "...", "type": "..."}]
+        """
+        cache_key = self._paper_cache_key(paper)
+        if cache_key:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"이미지 캐시 적중: {paper.get('title', '')[:50]}... ({len(cached)}개)")
+                return cached[:max_images]
+
+        title = paper.get('title', '')
+        arxiv_id = _normalize_arxiv_id(paper.get('arxiv_id') or '') or None
+
+        # arxiv_id가 없으면 제목으로 검색 (이후 조회들이 의존하므로 먼저 수행)
+        if not arxiv_id and title:
+            arxiv_id = await asyncio.to_thread(self._search_arxiv_by_title, title)
+            if arxiv_id:
+                paper['arxiv_id'] = arxiv_id
+
+        logger.info(f"이미지 동시 검색 시작: {title[:50]}... (arxiv_id: {arxiv_id})")
+
+        # 소스 우선순위 순서대로 조회 준비 (병합 시 이 순서가 유지됨)
+        probes = []
+        if arxiv_id:
+            probes.append(asyncio.to_thread(self._extract_ar5iv_figures, paper))
+        if arxiv_id and PYMUPDF_AVAILABLE:
+            probes.append(asyncio.to_thread(self._extract_pdf_images, paper, 3))
+        probes.append(asyncio.to_thread(self._extract_paperswithcode_images, paper))
+        if self.google_api_key and self.google_cx:
+            probes.append(asyncio.to_thread(self._search_google_images_enhanced, paper, max_images, 'architecture'))
+            probes.append(asyncio.to_thread(self._search_google_images_enhanced, paper, max_images, 'experiment'))
+        probes.append(asyncio.to_thread(self._scrape_google_images, paper, max_images))
+        if arxiv_id:
+            probes.append(asyncio.to_thread(self._extract_arxiv_images, paper))
+        if paper.get('url'):
+            probes.append(asyncio.to_thread(self._extract_direct_url_images, paper))
+
+        results = await asyncio.gather(*probes, return_exceptions=True)
+
+        # 우선순위 순서대로 병합 + 중복 제거 + URL 검증
+        images: List[Dict] = []
+        seen_urls: Set[str] = set()
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.debug(f"이미지 소스 조회 실패: {result}")
+                continue
+            for img in result:
+                key = _canonical_url(img['url'])
+                if key not in seen_urls and self._validate_image_url(img['url']):
+                    seen_urls.add(key)
                     images.append(img)
                     if len(images) >= max_images:
-                        return images[:max_images]
+                        break
+            if len(images) >= max_images:
+                break
 
-        logger.info(f"이미지 검색 완료: {len(images)}개 발견")
+        # 후보 전체를 한 번의 gather로 HEAD 검증 (죽은 링크 제거)
+        reachable = await self._validate_image_urls([img['url'] for img in images])
+        images = [img for img in images if img['url'] in reachable]
+
+        logger.info(f"이미지 동시 검색 완료: {len(images)}개 발견")
+        if cache_key:
+            self._cache_set(cache_key, images[:max_images])
         return images[:max_images]
 
+    def find_images_for_paper_concurrent(
+        self,
+        paper: Dict,
+        min_images: int = 1,
+        max_images: int = 5
+    ) -> List[Dict]:
+        """동기 호출자용 래퍼 - 소스 동시 조회 버전을 asyncio.run으로 실행"""
+        try:
+            return asyncio.run(self.find_images_for_paper_async(paper, min_images, max_images))
+        except RuntimeError:
+            # 이미 이벤트 루프가 실행 중인 컨텍스트에서는 순차 버전으로 폴백
+            logger.debug("실행 중인 이벤트 루프 감지 - 순차 이미지 검색으로 폴백")
+            return self.find_images_for_paper(paper, min_images, max_images)
+
+    @staticmethod
+    def _make_soup(markup: str, features: Optional[str] = None, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        HTML/XML 파싱 헬퍼 (soup 생성 지점을 한 곳으로 모음)
+
+        HTML은 lxml이 설치되어 있으면 lxml로, 없으면 html.parser로 파싱.
+        parse_only에 SoupStrainer를 주면 해당 태그만 파싱해 대형 페이지의
+        CPU/메모리 비용을 크게 줄임. 파싱은 수백 KB HTML에서 수십 ms가
+        걸리는 CPU 작업이라, 비동기 경로(find_images_for_paper_async)에서는
+        소스 조회 전체가 asyncio.to_thread 워커에서 실행되어 이벤트 루프를
+        막지 않음.
+        """
+        if features == 'xml' and _HTML_PARSER == 'lxml':
+            # 'lxml-xml'은 같은 libxml2 파서지만 기능 탐색 부트스트랩이 빠름
+            features = 'lxml-xml'
+        return BeautifulSoup(markup, features or _HTML_PARSER, parse_only=parse_only)
+
     def _extract_ar5iv_figures(self, paper: Dict) -> List[Dict]:
         """
         ar5iv.org (arXiv HTML 버전)에서 Figure 이미지 추출
@@ -239,7 +641,7 @@ class ImageFinder:
         ar5iv는 arXiv 논문을 HTML로 변환한 사이트로, Figure가 이미지로 제공됨
         """
         images = []
-        arxiv_id = paper.get('arxiv_id')
+        arxiv_id = _normalize_arxiv_id(paper.get('arxiv_id') or '') or None
 
         if not arxiv_id:
             return images
@@ -254,10 +656,10 @@ class ImageFinder:
             }
 
             logger.debug(f"ar5iv 페이지 요청: {ar5iv_url}")
-            response = requests.get(ar5iv_url, timeout=20, headers=headers, allow_redirects=True)
+            html = self._fetch_page(ar5iv_url, headers, timeout=20)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if html is not None:
+                soup = self._make_soup(html)
 
                 # Figure 요소 찾기 (ar5iv는 <figure> 태그 사용)
                 figures = soup.find_all('figure')
@@ -287,10 +689,9 @@ class ImageFinder:
                     caption_text = figcaption.get_text(strip=True)[:100] if figcaption else f"Figure {i+1}"
 
                     # 이미지 유형 판단
-                    caption_lower = caption_text.lower()
-                    if any(kw in caption_lower for kw in ['architecture', 'overview', 'framework', 'model', 'structure', 'network']):
+                    if _ARCH_CAPTION_RE.search(caption_text):
                         img_type = 'architecture'
-                    elif any(kw in caption_lower for kw in ['result', 'experiment', 'comparison', 'performance', 'accuracy', 'table']):
+                    elif _EXP_CAPTION_RE.search(caption_text):
                         img_type = 'experiment'
                     else:
                         img_type = 'intuitive'
@@ -308,7 +709,7 @@ class ImageFinder:
 
                 # Figure가 없으면 일반 이미지 태그에서 찾기
                 if not images:
-                    img_tags = soup.find_all('img', class_=re.compile(r'ltx_graphics|figure', re.I))
+                    img_tags = soup.find_all('img', class_=_LTX_GRAPHICS_RE)
                     for i, img in enumerate(img_tags[:5]):
                         src = img.get('src', '') or img.get('data-src', '')
                         if not src:
@@ -345,7 +746,7 @@ class ImageFinder:
         PDF를 다운로드하고 핵심 Figure 이미지를 스마트하게 선별
         """
         images = []
-        arxiv_id = paper.get('arxiv_id')
+        arxiv_id = _normalize_arxiv_id(paper.get('arxiv_id') or '') or None
         title = paper.get('title', 'paper')
 
         if not arxiv_id or not PYMUPDF_AVAILABLE:
@@ -355,34 +756,44 @@ class ImageFinder:
             arxiv_id_clean = arxiv_id.split('v')[0] if 'v' in arxiv_id else arxiv_id
             pdf_url = f"https://arxiv.org/pdf/{arxiv_id_clean}.pdf"
 
-            # 논문별 이미지 저장 폴더 생성
-            safe_title = re.sub(r'[^\w\-_]', '_', title)[:50]
-            paper_img_dir = self.IMAGE_DIR / safe_title
-            paper_img_dir.mkdir(parents=True, exist_ok=True)
+            # 논문별 이미지 저장 폴더 (캐시된 경로면 mkdir 생략)
+            paper_img_dir = self._paper_dir(paper)
+            safe_title = paper_img_dir.name
 
             # PDF 임시 저장
             pdf_path = paper_img_dir / "paper.pdf"
 
-            # PDF 다운로드 (캐시 없으면)
-            if not pdf_path.exists():
+            # PDF 다운로드 (캐시 없으면 메모리로 받아 바로 열고, 디스크 저장은 백그라운드)
+            if pdf_path.exists():
+                doc = fitz.open(pdf_path)
+            else:
                 logger.debug(f"PDF 다운로드 중: {pdf_url}")
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
                 }
-                response = requests.get(pdf_url, timeout=30, headers=headers, stream=True)
-                if response.status_code == 200:
-                    with open(pdf_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                else:
+                response = self._session.get(pdf_url, timeout=30, headers=headers, stream=True)
+                if response.status_code != 200:
                     logger.debug(f"PDF 다운로드 실패: {response.status_code}")
                     return images
 
-            # PDF에서 이미지 추출
-            doc = fitz.open(pdf_path)
+                # raw 스트림을 1MiB 단위 C 레벨 복사로 수신 (iter_content의
+                # 청크당 Python 루프/디코더 호출 제거)
+                buf = io.BytesIO()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buf, 1024 * 1024)
+                pdf_bytes = buf.getvalue()
+
+                # 디스크 쓰기+재읽기 없이 메모리 버퍼에서 바로 추출 시작
+                doc = fitz.open(stream=pdf_bytes, filetype='pdf')
 
-            # 모든 이미지 후보 수집 (전체 페이지에서)
-            candidates = []
+                # 다음 실행을 위한 캐시 저장은 추출 루프를 막지 않도록 별도 스레드에서
+                threading.Thread(target=pdf_path.write_bytes, args=(pdf_bytes,)).start()
+
+            # 상위 후보만 bounded heap으로 유지 (전체 정렬 불필요)
+            heap = []
+            heap_limit = max_images * 4
+            tiebreaker = 0
+            seen_xrefs = set()  # 여러 페이지에서 재사용되는 같은 이미지의 중복 압축해제 방지
 
             for page_num in range(min(15, len(doc))):  # 모든 페이지 검색
                 page = doc[page_num]
@@ -390,16 +801,14 @@ class ImageFinder:
 
                 for img_index, img_info in enumerate(image_list):
                     xref = img_info[0]
+                    if xref in seen_xrefs:
+                        continue
+                    seen_xrefs.add(xref)
 
                     try:
-                        base_image = doc.extract_image(xref)
-                        if not base_image:
-                            continue
-
-                        width = base_image.get('width', 0)
-                        height = base_image.get('height', 0)
-                        img_bytes = base_image.get('image', b'')
-                        img_size = len(img_bytes)
+                        # get_images가 이미 반환하는 픽셀 크기로 선필터링
+                        # (extract_image의 압축해제 비용을 아이콘/로고에 쓰지 않음)
+                        width, height = img_info[2], img_info[3]
 
                         # 최소 크기 제한 (300x200 이상 - 의미있는 다이어그램)
                         if width < 300 or height < 200:
@@ -410,6 +819,13 @@ class ImageFinder:
                         if aspect_ratio > 4:
                             continue
 
+                        base_image = doc.extract_image(xref)
+                        if not base_image:
+                            continue
+
+                        img_bytes = base_image.get('image', b'')
+                        img_size = len(img_bytes)
+
                         # 너무 작은 파일 제외 (아이콘/로고)
                         if img_size < 10000:  # 10KB 미만
                             continue
@@ -441,7 +857,7 @@ class ImageFinder:
                         if 30000 < img_size < 500000:
                             score += 15
 
-                        candidates.append({
+                        candidate = {
                             'page_num': page_num,
                             'img_index': img_index,
                             'width': width,
@@ -449,16 +865,26 @@ class ImageFinder:
                             'size': img_size,
                             'score': score,
                             'base_image': base_image
-                        })
+                        }
+                        tiebreaker += 1
+                        entry = (score, -tiebreaker, candidate)  # 동점 시 먼저 본 이미지 우선
+                        if len(heap) < heap_limit:
+                            heapq.heappush(heap, entry)
+                        else:
+                            heapq.heappushpop(heap, entry)
 
                     except Exception as e:
                         logger.debug(f"이미지 분석 실패 (page {page_num}, img {img_index}): {e}")
                         continue
 
-            # 스코어 순으로 정렬하여 상위 이미지 선택
-            candidates.sort(key=lambda x: x['score'], reverse=True)
+                # 아키텍처 Figure가 몰려 있는 1-5페이지에서 이미 고득점 후보를
+                # 충분히 확보했으면 나머지 페이지의 압축해제 비용을 생략
+                if page_num >= 4 and len(heap) >= max_images and heap[0][0] >= 75:
+                    break
 
-            for candidate in candidates[:max_images]:
+            # 스코어 순으로 상위 이미지 선택
+            write_futures = []
+            for _, _, candidate in heapq.nlargest(max_images, heap):
                 base_image = candidate['base_image']
                 page_num = candidate['page_num']
                 img_index = candidate['img_index']
@@ -467,8 +893,8 @@ class ImageFinder:
                 img_filename = f"figure_p{page_num+1}_{img_index+1}.{img_ext}"
                 img_path = paper_img_dir / img_filename
 
-                with open(img_path, 'wb') as f:
-                    f.write(base_image['image'])
+                # 파일 쓰기는 쓰기 풀에 맡기고 결과 목록 구성을 계속 진행
+                write_futures.append(self._io_pool.submit(img_path.write_bytes, base_image['image']))
 
                 relative_path = f"images/{safe_title}/{img_filename}"
 
@@ -483,6 +909,7 @@ class ImageFinder:
 
                 logger.debug(f"선택된 이미지: page {page_num+1}, {candidate['width']}x{candidate['height']}, score={candidate['score']}")
 
+            wait(write_futures)
             doc.close()
 
         except Exception as e:
@@ -493,7 +920,7 @@ class ImageFinder:
     def _extract_arxiv_images(self, paper: Dict) -> List[Dict]:
         """arXiv 논문 페이지에서 이미지 추출"""
         images = []
-        arxiv_id = paper.get('arxiv_id')
+        arxiv_id = _normalize_arxiv_id(paper.get('arxiv_id') or '') or None
 
         if not arxiv_id:
             return images
@@ -503,10 +930,10 @@ class ImageFinder:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, timeout=15, headers=headers)
+            html = self._fetch_page(url, headers, timeout=15)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if html is not None:
+                soup = self._make_soup(html, parse_only=_META_IMG_STRAINER)
 
                 # Open Graph 이미지 (메타 태그)
                 og_image = soup.find('meta', property='og:image')
@@ -541,82 +968,71 @@ class ImageFinder:
             return images
 
         title = paper.get('title', '')
-        authors = paper.get('authors', [])
-        first_author = authors[0] if isinstance(authors, list) and len(authors) > 0 else ''
-
-        # 이미지 유형별 검색 쿼리 생성
-        queries = []
 
+        # 이미지 유형별 키워드를 OR 연산자로 묶어 과금 쿼리 하나로 처리
         if image_type == 'architecture':
-            queries.append(f"{title} architecture diagram")
-            queries.append(f"{title} model architecture")
-            queries.append(f"{title} network diagram")
-            queries.append(f"{title} framework")
+            or_clause = '(architecture OR diagram OR framework OR model)'
         elif image_type == 'experiment':
-            queries.append(f"{title} experimental results")
-            queries.append(f"{title} performance comparison")
-            queries.append(f"{title} results graph")
+            or_clause = '(results OR experiment OR comparison OR performance)'
         else:
-            queries.append(f"{title} visualization")
-            queries.append(f"{title} overview")
-
-        # 제목에서 약어 추출
-        if title:
-            abbrev_match = re.search(r'\(([A-Za-z0-9\-]+)\)', title)
-            if abbrev_match:
-                abbrev = abbrev_match.group(1)
-                if image_type == 'architecture':
-                    queries.append(f"{abbrev} architecture")
-                elif image_type == 'experiment':
-                    queries.append(f"{abbrev} results")
+            or_clause = '(visualization OR overview)'
 
         seen_urls = set()
-        for query in queries[:4]:
-            if len(images) >= max_results:
-                break
-
-            try:
-                search_url = "https://www.googleapis.com/customsearch/v1"
-                params = {
-                    'key': self.google_api_key,
-                    'cx': self.google_cx,
-                    'q': query,
-                    'searchType': 'image',
-                    'num': min(5, max_results - len(images)),
-                    'safe': 'active',
-                    'imgSize': 'large',
-                    'fileType': 'jpg,png',
-                }
-
-                response = requests.get(search_url, params=params, timeout=10)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get('items', [])
-
-                    for item in items:
-                        img_url = item.get('link', '')
-                        if img_url and img_url not in seen_urls:
-                            seen_urls.add(img_url)
-                            image_title = item.get('title', '')
 
-                            images.append({
-                                'url': img_url,
-                                'title': image_title or f"{title} - {image_type.title()}",
-                                'source': f'Google ({query[:25]}...)',
-                                'type': image_type
-                            })
-                            if len(images) >= max_results:
-                                break
+        def collect(query: str, items: List[Dict]):
+            for item in items:
+                if len(images) >= max_results:
+                    return
+                img_url = item.get('link', '')
+                key = _canonical_url(img_url) if img_url else ''
+                if img_url and key not in seen_urls:
+                    seen_urls.add(key)
+                    image_title = item.get('title', '')
+                    images.append({
+                        'url': img_url,
+                        'title': image_title or f"{title} - {image_type.title()}",
+                        'source': f'Google ({query[:25]}...)',
+                        'type': image_type
+                    })
 
-                    time.sleep(0.3)
+        # OR 조합 쿼리 한 번으로 대부분 충분 (유형별 키워드 쿼리 4개 → 1개)
+        query = f"{title} {or_clause}"
+        collect(query, self._fetch_cse_items(query, 10))
 
-            except Exception as e:
-                logger.debug(f"Google 이미지 검색 실패 ({query[:25]}...): {e}")
-                continue
+        # 0건일 때만 제목 약어로 폴백 쿼리 한 번 더
+        if not images and title:
+            abbrev_match = _ABBREV_RE.search(title)
+            if abbrev_match:
+                abbrev = abbrev_match.group(1)
+                suffix = 'results' if image_type == 'experiment' else 'architecture'
+                fallback_query = f"{abbrev} {suffix}"
+                collect(fallback_query, self._fetch_cse_items(fallback_query, 10))
 
         return images
 
+    def _fetch_cse_items(self, query: str, num: int) -> List[Dict]:
+        """Google Custom Search API 호출, item 리스트 반환 (실패 시 빈 리스트)"""
+        try:
+            params = {
+                'key': self.google_api_key,
+                'cx': self.google_cx,
+                'q': query,
+                'searchType': 'image',
+                'num': num,
+                'safe': 'active',
+                'imgSize': 'large',
+                'fileType': 'jpg,png',
+                # 부분 응답으로 JSON 파싱/전송량 축소
+                'fields': 'items(link,title,image/thumbnailLink)',
+            }
+            self._google_rl.acquire()
+            response = self._session.get("https://www.googleapis.com/customsearch/v1", params=params, timeout=10)
+            if response.status_code == 200:
+                return response.json().get('items', [])
+        except Exception as e:
+            logger.debug(f"Google 이미지 검색 실패 ({query[:25]}...): {e}")
+        return []
+
     def _scrape_google_images(self, paper: Dict, max_results: int = 3) -> List[Dict]:
         """Google 이미지 검색 스크래핑 (API 키 없이)"""
         images = []
@@ -643,16 +1059,18 @@ class ImageFinder:
 
             try:
                 search_url = f"https://www.google.com/search?q={quote_plus(query)}&tbm=isch&safe=active"
-                response = requests.get(search_url, headers=headers, timeout=15)
+                self._scrape_rl.acquire()
+                response = self._session.get(search_url, headers=headers, timeout=15)
 
                 if response.status_code == 200:
-                    # 이미지 URL 패턴 찾기
                     # Google 이미지 검색 결과에서 이미지 URL 추출
-                    img_patterns = re.findall(r'"(https?://[^"]+\.(?:jpg|jpeg|png|webp))"', response.text, re.I)
+                    # (finditer로 필요한 만큼만 지연 스캔 - 전체 매치 리스트를 만들지 않음)
+                    for match in _IMG_URL_RE.finditer(response.text):
+                        img_url = match.group(1)
+                        lowered = img_url.lower()
 
-                    for img_url in img_patterns[:10]:
                         # 구글 자체 이미지/로고 제외
-                        if 'google' in img_url.lower() or 'gstatic' in img_url.lower():
+                        if 'google' in lowered or 'gstatic' in lowered:
                             continue
                         if len(img_url) < 50:  # 너무 짧은 URL 제외
                             continue
@@ -667,8 +1085,6 @@ class ImageFinder:
                         if len(images) >= max_results:
                             break
 
-                time.sleep(0.5)  # 요청 간 딜레이
-
             except Exception as e:
                 logger.debug(f"Google 이미지 스크래핑 실패: {e}")
                 continue
@@ -689,13 +1105,13 @@ class ImageFinder:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(search_url, timeout=15, headers=headers, allow_redirects=True)
+            response = self._session.get(search_url, timeout=15, headers=headers, allow_redirects=True)
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self._make_soup(response.text, parse_only=_CARD_IMG_STRAINER)
 
                 # 논문 카드에서 이미지 찾기
-                paper_cards = soup.find_all('div', class_=re.compile(r'paper-card|entity|row', re.I))
+                paper_cards = soup.find_all('div', class_=_PAPER_CARD_RE)
 
                 for card in paper_cards[:5]:
                     img_tags = card.find_all('img')
@@ -731,10 +1147,10 @@ class ImageFinder:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(paper_url, timeout=15, headers=headers, allow_redirects=True)
+            html = self._fetch_page(paper_url, headers, timeout=15)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if html is not None:
+                soup = self._make_soup(html, parse_only=_META_IMG_STRAINER)
 
                 # Open Graph 이미지
                 og_image = soup.find('meta', property='og:image')
@@ -756,8 +1172,8 @@ class ImageFinder:
                     if not src:
                         continue
 
-                    alt_text = img.get('alt', '').lower()
-                    if any(keyword in alt_text for keyword in ['architecture', 'diagram', 'figure', 'model', 'network']):
+                    alt_text = img.get('alt', '')
+                    if _ALT_TEXT_RE.search(alt_text):
                         full_url = src if src.startswith('http') else urljoin(paper_url, src)
                         images.append({
                             'url': full_url,
@@ -774,24 +1190,34 @@ class ImageFinder:
         return images
 
     def _validate_image_url(self, url: str) -> bool:
-        """이미지 URL 유효성 검증"""
-        if not url or len(url) < 5:
-            return False
+        """이미지 URL 유효성 검증 (상대 images/ 경로 또는 http(s)+호스트)"""
+        return bool(url) and len(url) >= 5 and _VALID_URL_RE.match(url) is not None
 
-        # 상대 경로 허용 (images/...)
-        if url.startswith('images/'):
-            return True
 
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or parsed.scheme not in ['http', 'https']:
-                return False
-            if not parsed.netloc:
-                return False
-        except Exception:
-            return False
+@lru_cache(maxsize=8192)
+def _canonical_url(url: str) -> str:
+    """URL 중복 판정용 정규화 키 (스킴/쿼리/프래그먼트 차이 무시)"""
+    try:
+        parsed = urlparse(url.lower())
+        return f"{parsed.netloc}{parsed.path}"
+    except Exception:
+        return url
+
+
+@lru_cache(maxsize=4096)
+def _normalize_arxiv_id(arxiv_id: str) -> str:
+    """'arXiv:' 접두사/공백을 제거한 순수 arxiv_id 반환 (결과는 캐시됨)"""
+    return arxiv_id.replace('arXiv:', '').strip()
+
 
-        return True
+@lru_cache(maxsize=256)
+def _render_image_block(title: str, url: str, source: str) -> str:
+    """이미지 마크다운 블록 생성 (같은 이미지 재렌더링 시 캐시 적중)"""
+    if not url:
+        return ''
+    if source:
+        return f"![{title}]({url})\n*출처: {source}*"
+    return f"![{title}]({url})"
 
 
 def insert_images_to_content(content: str, images: List[Dict], paper_title: str) -> str:
@@ -809,80 +1235,81 @@ def insert_images_to_content(content: str, images: List[Dict], paper_title: str)
     if not images:
         return content
 
-    # 이미지를 유형별로 분류
-    arch_images = [img for img in images if img.get('type') == 'architecture']
-    exp_images = [img for img in images if img.get('type') == 'experiment']
-    other_images = [img for img in images if img.get('type') not in ['architecture', 'experiment']]
-
-    # 이미지 마크다운 형식 생성
-    def create_image_block(img: Dict) -> List[str]:
-        title = img.get('title', '이미지')
-        url = img.get('url', '')
-
-        if url:
-            lines = [f"![{title}]({url})"]
-            if img.get('source'):
-                lines.append(f"*출처: {img['source']}*")
-            return lines
-        return []
+    # 이미지를 유형별로 분류 (한 번의 순회로 버킷에 나눔, 소비는 popleft O(1))
+    arch_images, exp_images, other_images = deque(), deque(), deque()
+    buckets = {'architecture': arch_images, 'experiment': exp_images}
+    for img in images:
+        buckets.get(img.get('type'), other_images).append(img)
+
+    def create_image_block(img: Dict) -> str:
+        return _render_image_block(img.get('title', '이미지'), img.get('url', ''), img.get('source', ''))
 
     lines = content.split('\n')
+
+    # 1단계: 섹션 헤더(##)를 한 번만 순회하며 수집
+    sections = []  # (줄 인덱스, 헤더 원문)
+    for i, line in enumerate(lines):
+        if line.startswith('##') and not line.startswith('###'):
+            sections.append((i, line))
+
+    # 2단계: 삽입 계획 수립 (원본 줄 인덱스 기준, 실제 삽입은 아직 안 함)
+    plans = []  # (삽입 위치, 이미지 블록 문자열)
     inserted_count = 0
 
-    # 1. 아키텍처 이미지: "방법", "아키텍처", "구조" 관련 섹션 뒤
+    def plan_insert(section_idx: int, img: Dict):
+        nonlocal inserted_count
+        plans.append((min(section_idx + 8, len(lines)), create_image_block(img)))
+        inserted_count += 1
+
+    # 아키텍처 이미지: "방법", "아키텍처", "구조" 관련 섹션 뒤
     if arch_images:
-        for i, line in enumerate(lines):
-            if line.startswith('##') and not line.startswith('###'):
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['방법', '해결', '아키텍처', '구조', 'method', 'approach', 'architecture', 'key idea', '핵심']):
-                    insert_pos = min(i + 8, len(lines))
-                    img_block = create_image_block(arch_images[0])
-                    for img_line in reversed(img_block):
-                        lines.insert(insert_pos, img_line)
-                    lines.insert(insert_pos, '')  # 빈 줄 추가
-                    inserted_count += 1
-                    arch_images = arch_images[1:]
-                    break
+        for i, header in sections:
+            if _METHOD_SECTION_RE.search(header):
+                plan_insert(i, arch_images.popleft())
+                break
 
-    # 2. 실험 결과 이미지: "실험", "결과" 관련 섹션 뒤
+    # 실험 결과 이미지: "실험", "결과" 관련 섹션 뒤
     if exp_images:
-        for i, line in enumerate(lines):
-            if line.startswith('##') and not line.startswith('###'):
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['실험', '결과', 'experiment', 'result', 'evaluation', '평가']):
-                    insert_pos = min(i + 8, len(lines))
-                    img_block = create_image_block(exp_images[0])
-                    for img_line in reversed(img_block):
-                        lines.insert(insert_pos, img_line)
-                    lines.insert(insert_pos, '')
-                    inserted_count += 1
-                    exp_images = exp_images[1:]
-                    break
-
-    # 3. 추가 아키텍처 이미지가 있으면 다른 섹션에 삽입
-    remaining_images = arch_images + exp_images + other_images
-    if remaining_images and inserted_count < 3:
-        for i, line in enumerate(lines):
-            if inserted_count >= 3:
+        for i, header in sections:
+            if _RESULT_SECTION_RE.search(header):
+                plan_insert(i, exp_images.popleft())
                 break
-            if line.startswith('##') and not line.startswith('###') and i > 10:
-                insert_pos = min(i + 8, len(lines))
-                img_block = create_image_block(remaining_images[0])
-                for img_line in reversed(img_block):
-                    lines.insert(insert_pos, img_line)
-                lines.insert(insert_pos, '')
-                inserted_count += 1
-                remaining_images = remaining_images[1:]
+
+    # 추가 이미지가 있으면 다른 섹션에 삽입 (최대 3개까지)
+    remaining_images = deque()
+    remaining_images.extend(arch_images)
+    remaining_images.extend(exp_images)
+    remaining_images.extend(other_images)
+    for i, _header in sections:
+        if inserted_count >= 3 or not remaining_images:
+            break
+        if i > 10:
+            plan_insert(i, remaining_images.popleft())
 
     # 이미지가 하나도 삽입되지 않았으면 첫 번째 섹션 뒤에 추가
-    if inserted_count == 0 and images:
-        for i, line in enumerate(lines):
-            if line.startswith('##') and not line.startswith('###'):
-                insert_pos = min(i + 8, len(lines))
-                img_block = create_image_block(images[0])
-                for img_line in reversed(img_block):
-                    lines.insert(insert_pos, img_line)
-                lines.insert(insert_pos, '')
-                break
+    if inserted_count == 0 and sections:
+        plan_insert(sections[0][0], images[0])
+
+    if not plans:
+        return content
 
-    return '\n'.join(lines)
+    # 3단계: 단일 패스로 결과 조립 (lines.insert의 O(n) 이동 비용 제거)
+    def emit_block(block: str):
+        out.append('')  # 블록 앞 빈 줄
+        if block:
+            out.append(block)
+
+    plans.sort(key=lambda p: p[0])
+    out = []
+    plan_idx = 0
+    for i, line in enumerate(lines):
+        while plan_idx < len(plans) and plans[plan_idx][0] == i:
+            emit_block(plans[plan_idx][1])
+            plan_idx += 1
+        out.append(line)
+
+    # 문서 끝 위치(len(lines))에 계획된 블록 처리
+    for _, block in plans[plan_idx:]:
+        emit_block(block)
+
+    return '\n'.join(out)
@@ -2,6 +2,7 @@
 논문 리스트 수집기 (Claude 활용)
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, List, Dict
 
 if TYPE_CHECKING:
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트에 포함할 최근 제외 제목 개수 (전체 목록을 보내면 토큰 비용이 O(누적 수집량)로 증가)
+_EXCLUDE_TITLES_WINDOW = 200
+
 
 class PaperCollector:
     """논문 리스트 수집 및 관리"""
@@ -47,6 +51,7 @@ class PaperCollector:
         try:
             all_papers = []
             seen_titles = set()  # 전체 중복 제거를 위한 제목 집합
+            ordered_seen = []    # 수집 순서 (프롬프트에 보낼 최근 제외 목록용)
             
             for category_idx, category in enumerate(categories, 1):
                 name = category.get('name', f'카테고리 {category_idx}')
@@ -64,8 +69,9 @@ class PaperCollector:
                 category_seen_titles = set(seen_titles)  # 현재 카테고리용 중복 제거
                 
                 # 1단계: 제목 리스트 수집 (전체 개수 한 번에 요청)
-                exclude_titles = list(category_seen_titles)
-                logger.info(f"[1단계] {name} - {count}개 논문 제목 요청 중... (이미 {len(exclude_titles)}개 제외)")
+                # 프롬프트에는 최근 제목만 보내고, 정확한 중복 제거는 로컬 집합이 담당
+                exclude_titles = ordered_seen[-_EXCLUDE_TITLES_WINDOW:]
+                logger.info(f"[1단계] {name} - {count}개 논문 제목 요청 중... (최근 {len(exclude_titles)}개 제외, 누적 {len(seen_titles)}개)")
                 
                 try:
                     # 제목만 한 번에 요청
@@ -99,24 +105,33 @@ class PaperCollector:
                 # 2단계: 상세 정보 요청 (10개씩 배치로 나눠서 요청)
                 logger.info(f"\n[2단계] {name} - {len(category_titles)}개 논문의 상세 정보 요청 중...")
                 
-                detailed_papers = []
                 detail_batch_size = 10  # 상세 정보는 한 번에 10개씩
-                
-                for i in range(0, len(category_titles), detail_batch_size):
-                    batch_titles = category_titles[i:i + detail_batch_size]
-                    batch_num = (i // detail_batch_size) + 1
-                    total_batches = (len(category_titles) + detail_batch_size - 1) // detail_batch_size
-                    
-                    logger.info(f"[2단계] {name} - 배치 {batch_num}/{total_batches}: {len(batch_titles)}개 논문 상세 정보 요청 중...")
-                    
-                    try:
-                        batch_details = self.claude_client.generate_paper_details(batch_titles)
-                        detailed_papers.extend(batch_details)
-                        logger.info(f"[2단계] 배치 {batch_num} 완료: {len(batch_details)}개 논문 상세 정보 추가")
-                        
-                    except Exception as e:
-                        logger.warning(f"[2단계] 배치 {batch_num} 오류 (계속 진행): {e}", exc_info=True)
-                        continue
+                batches = [
+                    category_titles[i:i + detail_batch_size]
+                    for i in range(0, len(category_titles), detail_batch_size)
+                ]
+                total_batches = len(batches)
+
+                # 배치별 호출은 서로 독립적이므로 동시에 요청 (순차 대비 RTT 합 → 최대값)
+                batch_results: List[List[Dict]] = [[] for _ in batches]
+                with ThreadPoolExecutor(max_workers=min(8, total_batches)) as executor:
+                    futures = {
+                        executor.submit(self.claude_client.generate_paper_details, batch): idx
+                        for idx, batch in enumerate(batches)
+                    }
+                    for future in as_completed(futures):
+                        batch_num = futures[future] + 1
+                        try:
+                            batch_details = future.result()
+                            batch_results[futures[future]] = batch_details
+                            logger.info(f"[2단계] {name} - 배치 {batch_num}/{total_batches} 완료: {len(batch_details)}개 논문 상세 정보 추가")
+                        except Exception as e:
+                            # 전체 트레이스백 포착은 DEBUG 레벨일 때만 (일시적 API 오류마다 스택 포맷팅 방지)
+                            logger.warning(f"[2단계] 배치 {batch_num} 오류 (계속 진행): {e}",
+                                           exc_info=logger.isEnabledFor(logging.DEBUG))
+
+                # 원래 배치 순서대로 병합 (중복 제거 결과가 실행마다 달라지지 않도록)
+                detailed_papers = [paper for batch in batch_results for paper in batch]
                 
                 # 전체 중복 제거
                 final_category_papers = []
@@ -124,6 +139,7 @@ class PaperCollector:
                     title = paper.get('title', '').strip().lower()
                     if title and title not in seen_titles:
                         seen_titles.add(title)
+                        ordered_seen.append(title)
                         final_category_papers.append(paper)
                 
                 all_papers.extend(final_category_papers)
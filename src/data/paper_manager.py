@@ -1,14 +1,57 @@
 """
 논문 리스트 관리자
 """
+import atexit
 import json
 import logging
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# orjson이 설치되어 있으면 사용 (대형 papers.json 직렬화가 수 배 빠름)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson이 설치되어 있으면 papers.json을 스트리밍 파싱 (피크 메모리 절감)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# 델타 로그 몇 건마다 전체 스냅샷을 다시 쓸지
+_SNAPSHOT_INTERVAL = 20
+
+
+def _read_json(path: Path):
+    """JSON 파일 로드 (orjson 우선, 없으면 표준 json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data):
+    """
+    JSON 파일 저장 (orjson은 UTF-8 네이티브라 ensure_ascii 불필요)
+
+    임시 파일에 쓰고 os.replace로 교체해, 쓰는 도중 프로세스가 죽어도
+    기존 파일이 깨지지 않도록 함 (POSIX/Windows 모두 원자적).
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    if ORJSON_AVAILABLE:
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
 
 class PaperManager:
     """논문 리스트 관리 및 순차 선택"""
@@ -22,11 +65,16 @@ class PaperManager:
         """
         self.papers_file = Path(papers_file)
         self.state_file = Path(state_file)
-        
+
+        # 스냅샷 사이의 변경분만 담는 append 전용 델타 로그
+        self._state_log_file = self.state_file.with_suffix('.jsonl')
+        self._mutations_since_snapshot = 0
+        self._last_saved_fingerprint = None
+
         # 디렉토리 생성
         self.papers_file.parent.mkdir(parents=True, exist_ok=True)
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         self.papers = self._load_papers()
         
         # 첫 실행 감지 (state_file이 없거나 빈 경우)
@@ -38,7 +86,13 @@ class PaperManager:
             self._save_state()
         else:
             self.state = self._load_state()
-    
+
+        # 멤버십 검사용 집합 (리스트는 직렬화 순서 유지용으로만 유지)
+        self._reviewed_set = set(self.state.get('reviewed_papers', []))
+
+        # 종료 시 델타 로그를 스냅샷으로 접어 넣음
+        atexit.register(self._save_state)
+
     def _load_papers(self) -> List[Dict]:
         """논문 리스트 로드"""
         if not self.papers_file.exists():
@@ -52,13 +106,21 @@ class PaperManager:
                 logger.warning(f"논문 리스트 파일이 비어있습니다: {self.papers_file} (빈 리스트로 시작)")
                 return []
             
+            # ijson이 있으면 전체 문자열을 메모리에 올리지 않고 스트리밍 파싱
+            if IJSON_AVAILABLE:
+                papers = self._stream_load_papers()
+                if papers is not None:
+                    self._attach_paper_ids(papers)
+                    logger.info(f"{len(papers)}개의 논문 로드됨")
+                    return papers
+
             with open(self.papers_file, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
                 if not content:
                     logger.warning(f"논문 리스트 파일에 내용이 없습니다: {self.papers_file} (빈 리스트로 시작)")
                     return []
                 
-                data = json.loads(content)
+                data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
                 papers = data.get('papers', []) if isinstance(data, dict) else data
                 
                 # papers가 리스트인지 확인
@@ -66,6 +128,7 @@ class PaperManager:
                     logger.warning(f"논문 리스트 형식이 올바르지 않습니다 (리스트가 아님): {self.papers_file} (빈 리스트로 시작)")
                     return []
                 
+                self._attach_paper_ids(papers)
                 logger.info(f"{len(papers)}개의 논문 로드됨")
                 return papers
                 
@@ -76,6 +139,28 @@ class PaperManager:
             logger.error(f"논문 리스트 로드 실패: {e} (파일: {self.papers_file}) - 빈 리스트로 시작", exc_info=True)
             return []
     
+    def _stream_load_papers(self) -> Optional[List[Dict]]:
+        """papers.json을 ijson으로 스트리밍 파싱 (실패 시 None → 일반 로드로 폴백)"""
+        try:
+            with open(self.papers_file, 'rb') as f:
+                # 최상위가 {"papers": [...]}인지 [...]인지 첫 문자로 판별
+                first = f.read(1)
+                while first and first.isspace():
+                    first = f.read(1)
+                if not first:
+                    return []
+                prefix = 'papers.item' if first == b'{' else 'item'
+                f.seek(0)
+                # use_float=True: Decimal 대신 float로 받아 이후 json 직렬화 호환 유지
+                papers = list(ijson.items(f, prefix, use_float=True))
+            if not all(isinstance(p, dict) for p in papers):
+                logger.warning(f"논문 리스트 형식이 올바르지 않습니다: {self.papers_file} (빈 리스트로 시작)")
+                return []
+            return papers
+        except Exception as e:
+            logger.warning(f"스트리밍 파싱 실패, 일반 로드로 전환: {e}")
+            return None
+
     def _save_papers(self):
         """논문 리스트 저장"""
         try:
@@ -83,8 +168,7 @@ class PaperManager:
                 'papers': self.papers,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.papers_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(self.papers_file, data)
             logger.info(f"{len(self.papers)}개의 논문 저장됨")
         except Exception as e:
             logger.error(f"논문 리스트 저장 실패: {e}")
@@ -93,21 +177,73 @@ class PaperManager:
         """진행 상태 로드"""
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    # 기존 형식 호환성 유지 (필드가 없으면 기본값 추가)
-                    if 'last_processed' not in state:
-                        state['last_processed'] = None
-                    if 'first_run_at' not in state:
-                        state['first_run_at'] = None
-                    return state
+                state = _read_json(self.state_file)
+                # 기존 형식 호환성 유지 (필드가 없으면 기본값 추가)
+                if 'last_processed' not in state:
+                    state['last_processed'] = None
+                if 'first_run_at' not in state:
+                    state['first_run_at'] = None
+                return self._replay_state_log(state)
             except Exception as e:
                 logger.error(f"상태 파일 로드 실패: {e}")
-                return {'current_index': 0, 'reviewed_papers': [], 'last_processed': None, 'first_run_at': None}
-        return {'current_index': 0, 'reviewed_papers': [], 'last_processed': None, 'first_run_at': None}
-    
+                return self._replay_state_log({'current_index': 0, 'reviewed_papers': [], 'last_processed': None, 'first_run_at': None})
+        return self._replay_state_log({'current_index': 0, 'reviewed_papers': [], 'last_processed': None, 'first_run_at': None})
+
+    def _replay_state_log(self, state: dict) -> dict:
+        """스냅샷 이후 델타 로그(JSONL)에 기록된 리뷰 완료 건을 상태에 반영"""
+        if not self._state_log_file.exists():
+            return state
+        try:
+            reviewed = state.setdefault('reviewed_papers', [])
+            seen = set(reviewed)
+            with open(self._state_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    paper_id = entry.get('paper_id')
+                    if paper_id and paper_id not in seen:
+                        seen.add(paper_id)
+                        reviewed.append(paper_id)
+                    index = entry.get('index')
+                    if index is not None:
+                        state['current_index'] = max(state.get('current_index', 0), index + 1)
+        except Exception as e:
+            logger.error(f"상태 로그 재생 실패: {e}")
+        return state
+
+    def _record_reviewed_delta(self, paper_id: str, index: Optional[int] = None):
+        """
+        리뷰 완료 한 건을 델타 로그에 추가
+
+        논문 하나 처리할 때마다 전체 reviewed_papers를 다시 직렬화하지
+        않도록 한 줄만 append하고, _SNAPSHOT_INTERVAL건마다 전체 스냅샷을
+        다시 씀. 로그 기록에 실패하면 안전하게 전체 스냅샷으로 폴백.
+        """
+        try:
+            entry = {'paper_id': paper_id, 'index': index, 'ts': datetime.now().isoformat()}
+            with open(self._state_log_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except Exception as e:
+            logger.error(f"상태 로그 기록 실패: {e}")
+            self._save_state()
+            return
+
+        self._mutations_since_snapshot += 1
+        if self._mutations_since_snapshot >= _SNAPSHOT_INTERVAL:
+            self._save_state()
+
     def _save_state(self):
-        """진행 상태 저장 (상세 정보 포함)"""
+        """진행 상태 저장 (상세 정보 포함, 내용이 그대로면 쓰기 생략)"""
+        fingerprint = (
+            self.state.get('current_index', 0),
+            len(self.state.get('reviewed_papers', [])),
+            (self.state.get('last_processed') or {}).get('paper_id'),
+        )
+        if fingerprint == self._last_saved_fingerprint and self._mutations_since_snapshot == 0:
+            return
+
         try:
             # 저장할 때 통계 정보 추가
             state_to_save = {
@@ -123,8 +259,13 @@ class PaperManager:
                     'progress_percent': round((len(self.state.get('reviewed_papers', [])) / len(self.papers) * 100), 2) if self.papers else 0
                 }
             }
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(state_to_save, f, ensure_ascii=False, indent=2)
+            _write_json(self.state_file, state_to_save)
+
+            # 스냅샷에 접힌 델타 로그는 비움
+            if self._state_log_file.exists():
+                self._state_log_file.write_text('', encoding='utf-8')
+            self._mutations_since_snapshot = 0
+            self._last_saved_fingerprint = fingerprint
         except Exception as e:
             logger.error(f"상태 파일 저장 실패: {e}")
     
@@ -136,6 +277,7 @@ class PaperManager:
             papers: 논문 리스트 (원래 순서 유지)
         """
         # papers.json의 원래 순서 유지 (정렬하지 않음)
+        self._attach_paper_ids(papers)
         self.papers = papers
         self._save_papers()
         logger.info(f"{len(self.papers)}개의 논문이 원래 순서대로 저장됨")
@@ -152,25 +294,25 @@ class PaperManager:
             return None
         
         current_index = self.state.get('current_index', 0)
-        reviewed_papers = self.state.get('reviewed_papers', [])
-        
+
         # 아직 리뷰하지 않은 논문 찾기
         for i in range(current_index, len(self.papers)):
             paper = self.papers[i]
             paper_id = self._get_paper_id(paper)
-            
-            if paper_id not in reviewed_papers:
+
+            if paper_id not in self._reviewed_set:
                 # 상태 업데이트 (마지막 처리 논문 정보 추가)
                 self.state['current_index'] = i + 1
                 self.state['reviewed_papers'].append(paper_id)
+                self._reviewed_set.add(paper_id)
                 self.state['last_processed'] = {
                     'paper_id': paper_id,
                     'title': paper.get('title', 'N/A'),
                     'index': i,
                     'processed_at': datetime.now().isoformat()
                 }
-                self._save_state()
-                
+                self._record_reviewed_delta(paper_id, i)
+
                 logger.info(f"다음 논문 선택: {paper.get('title', 'N/A')} (인덱스: {i})")
                 return paper
         
@@ -178,6 +320,7 @@ class PaperManager:
         logger.info("모든 논문을 리뷰했습니다. 처음부터 다시 시작합니다.")
         self.state['current_index'] = 0
         self.state['reviewed_papers'] = []
+        self._reviewed_set = set()
         self._save_state()
         
         # 처음 논문 반환
@@ -186,16 +329,22 @@ class PaperManager:
             paper_id = self._get_paper_id(paper)
             self.state['current_index'] = 1
             self.state['reviewed_papers'].append(paper_id)
-            self._save_state()
+            self._reviewed_set.add(paper_id)
+            self._record_reviewed_delta(paper_id, 0)
             return paper
         
         return None
     
+    @staticmethod
+    def _attach_paper_ids(papers: List[Dict]):
+        """논문 ID를 한 번만 계산해 dict에 캐시 (핫 루프의 포맷팅 제거)"""
+        for paper in papers:
+            if isinstance(paper, dict) and '_id' not in paper:
+                paper['_id'] = f"{paper.get('title', '')}_{paper.get('year', '')}"
+
     def _get_paper_id(self, paper: Dict) -> str:
-        """논문 고유 ID 생성"""
-        title = paper.get('title', '')
-        year = paper.get('year', '')
-        return f"{title}_{year}"
+        """논문 고유 ID 반환 (캐시된 _id 우선)"""
+        return paper.get('_id') or f"{paper.get('title', '')}_{paper.get('year', '')}"
     
     def mark_paper_reviewed(self, paper: Dict):
         """
@@ -205,9 +354,10 @@ class PaperManager:
             paper: 논문 정보
         """
         paper_id = self._get_paper_id(paper)
-        if paper_id not in self.state.get('reviewed_papers', []):
+        if paper_id not in self._reviewed_set:
             self.state.setdefault('reviewed_papers', []).append(paper_id)
-            self._save_state()
+            self._reviewed_set.add(paper_id)
+            self._record_reviewed_delta(paper_id)
             logger.info(f"논문 리뷰 완료 표시: {paper.get('title', 'N/A')}")
     
     def get_paper_count(self) -> int:
@@ -226,6 +376,7 @@ class PaperManager:
             'last_processed': None,
             'first_run_at': datetime.now().isoformat()
         }
+        self._reviewed_set = set()
         self._save_state()
         logger.info("진행 상태가 초기화되었습니다.")
     
@@ -268,11 +419,10 @@ class PaperManager:
         Returns:
             미리뷰 논문 리스트 (인덱스 포함)
         """
-        reviewed_papers = self.state.get('reviewed_papers', [])
         unreviewed = []
         for i, paper in enumerate(self.papers):
             paper_id = self._get_paper_id(paper)
-            if paper_id not in reviewed_papers:
+            if paper_id not in self._reviewed_set:
                 paper_with_index = paper.copy()
                 paper_with_index['_index'] = i
                 unreviewed.append(paper_with_index)
@@ -293,15 +443,16 @@ class PaperManager:
             if paper:
                 # 상태 업데이트
                 paper_id = self._get_paper_id(paper)
-                if paper_id not in self.state.get('reviewed_papers', []):
+                if paper_id not in self._reviewed_set:
                     self.state.setdefault('reviewed_papers', []).append(paper_id)
+                    self._reviewed_set.add(paper_id)
                 self.state['last_processed'] = {
                     'paper_id': paper_id,
                     'title': paper.get('title', 'N/A'),
                     'index': index,
                     'processed_at': datetime.now().isoformat()
                 }
-                self._save_state()
+                self._record_reviewed_delta(paper_id, index)
                 logger.info(f"지정된 논문 선택: {paper.get('title', 'N/A')} (인덱스: {index})")
                 return paper
             return None
@@ -311,5 +462,5 @@ class PaperManager:
     def is_paper_reviewed(self, paper: Dict) -> bool:
         """논문이 이미 리뷰되었는지 확인"""
         paper_id = self._get_paper_id(paper)
-        return paper_id in self.state.get('reviewed_papers', [])
+        return paper_id in self._reviewed_set
 
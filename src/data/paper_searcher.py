@@ -14,20 +14,341 @@
 import requests
 import random
 import logging
+import gzip
 import json
+import os
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from abc import ABC, abstractmethod
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
 import hashlib
+import zlib
+
+# lxml(C 파서)이 있으면 사용 — arXiv Atom 파싱이 stdlib ElementTree보다 10배 이상 빠름
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+# orjson이 있으면 사용 (CrossRef/OpenAlex처럼 큰 JSON 응답 디코딩이 수배 빠름)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson이 있으면 papers.json을 스트리밍 병합 (아카이브가 커져도 피크 메모리 일정)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# 모든 소스가 공유하는 세션 (keep-alive 재사용으로 호출마다의 TCP+TLS 핸드셰이크 제거)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+_SESSION.headers["User-Agent"] = "TistoryAutoPoster/1.0"
+
+
+def _decode_json(response) -> Dict:
+    """API 응답 JSON 디코딩 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# 소스 API 응답 디스크 캐시 (동일 쿼리 반복 시 원격 호출 생략)
+_CACHE_DIR = PROJECT_ROOT / ".cache" / "papers"
+_CACHE_TTL = 21600  # 6시간
+_CACHE_HASH_KEY = b"papers-v1"  # 키 버전 변경으로 캐시 전체 무효화 가능
+
+
+class _CachedResponse:
+    """디스크 캐시에서 복원한 응답 (requests.Response 인터페이스 일부만 제공)"""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.text = content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        pass  # 성공 응답만 캐시에 저장됨
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _cached_get(url: str, params: Dict = None, ttl: int = _CACHE_TTL, **kwargs):
+    """_SESSION.get에 TTL 디스크 캐시를 씌운 래퍼
+
+    캐시 키는 (url, 정렬된 params)의 keyed blake2b 해시. TTL 내 동일
+    쿼리는 원격 API를 다시 호출하지 않으므로 레이트 리밋 소모와 지연이
+    사라진다. 본문은 gzip으로 압축 저장한다 (JSON/XML은 보통 5배 이상
+    줄어 캐시 디렉터리가 수 MB 수준으로 유지됨).
+    """
+    key_src = json.dumps([url, sorted((params or {}).items())], ensure_ascii=False, default=str)
+    key = hashlib.blake2b(key_src.encode(), key=_CACHE_HASH_KEY, digest_size=16).hexdigest()
+    cache_path = _CACHE_DIR / f"{key}.gz"
+
+    try:
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < ttl:
+            return _CachedResponse(gzip.decompress(cache_path.read_bytes()))
+    except OSError:
+        pass  # 캐시 읽기 실패는 원격 호출로 대체
+
+    response = _SESSION.get(url, params=params, **kwargs)
+    response.raise_for_status()
+
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(gzip.compress(response.content, compresslevel=1))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"응답 캐시 저장 실패: {e}")
+
+    return response
+
+
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """키워드 목록을 단일 교대(alternation) 정규식으로 컴파일
+
+    논문마다 키워드 개수만큼 substring 스캔을 반복하는 대신 텍스트를
+    한 번만 훑는다. 긴 키워드를 앞에 두어 구(句) 키워드가 부분 단어에
+    가려지지 않게 한다.
+    """
+    escaped = sorted((re.escape(kw.lower()) for kw in keywords), key=len, reverse=True)
+    return re.compile("|".join(escaped))
+
+
+def _keyword_score(pattern: "re.Pattern", text: str) -> int:
+    """텍스트 한 번 스캔으로 서로 다른 키워드 적중 수 계산"""
+    return len({m.group(0) for m in pattern.finditer(text)})
+
+
+def _split_by_categories(
+    papers: List[Dict],
+    categories: List[str],
+    keywords_map: Dict[str, List[str]],
+    count_per: int
+) -> Dict[str, List[Dict]]:
+    """한 번에 받아온 논문 풀을 카테고리별 키워드 점수로 분배
+
+    카테고리 순서대로 아직 배정되지 않은 논문 중 점수 상위 count_per개를
+    가져가며, 논문 하나는 한 카테고리에만 속한다.
+    """
+    results: Dict[str, List[Dict]] = {}
+    assigned = set()
+
+    for category in categories:
+        keywords = keywords_map.get(category) or []
+        pattern = _keyword_pattern(keywords) if keywords else None
+
+        scored = []
+        for idx, paper in enumerate(papers):
+            if idx in assigned:
+                continue
+            text = paper.get("_searchable") or f"{paper.get('title', '')} {paper.get('abstract', '')}".lower()
+            score = _keyword_score(pattern, text) if pattern else 0
+            scored.append((score, idx))
+        scored.sort(key=lambda x: x[0], reverse=True)
+
+        picked = []
+        for _, idx in scored[:count_per]:
+            assigned.add(idx)
+            paper = papers[idx]
+            paper["searched_category"] = category
+            picked.append(paper)
+        results[category] = picked
+
+    return results
+
+
+def _dumps_entry(entry: Dict) -> str:
+    """항목 하나를 JSON 문자열로 (스트리밍 병합에서 리스트 전체 직렬화 회피)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry).decode()
+    return json.dumps(entry, ensure_ascii=False)
+
+
+def _title_key(paper: Dict) -> str:
+    """중복 제거용 소문자 제목 키 (최초 1회만 계산해 dict에 메모)"""
+    key = paper.get("_title_key")
+    if key is None:
+        key = paper.get("title", "").lower()
+        paper["_title_key"] = key
+    return key
+
+
+def _daily_rng(category: str) -> random.Random:
+    """날짜+카테고리로 시드된 RNG
+
+    같은 날 같은 카테고리 검색은 항상 같은 쿼리 파라미터를 만들므로
+    디스크 응답 캐시(및 업스트림 HTTP 캐시)가 적중한다. 날이 바뀌면
+    시드도 바뀌어 결과 다양성은 유지된다.
+    """
+    return random.Random(f"{datetime.now().date().isoformat()}:{category}")
+
+
+# 분야 코드 → 카테고리 이름 매핑 (2024-2025 최신 트렌드 반영)
+# 호출마다 딕셔너리 리터럴을 새로 만들지 않도록 모듈 상수로 둠
+_FIELD_TO_CATEGORY = {
+    # LLM & 추론
+    "llm_reasoning": "LLM & Reasoning",
+    "ai_agents": "AI Agents",
+    "code_generation": "Code Generation",
+    "rag_knowledge": "RAG & Knowledge",
+    # 비전 & 멀티모달
+    "computer_vision": "Computer Vision",
+    "vision_language": "Vision-Language Models",
+    "video_world": "Video & World Models",
+    "3d_spatial": "3D & Spatial AI",
+    # 생성 모델
+    "image_generation": "Image Generation",
+    "audio_speech": "Audio & Speech",
+    # 학습 & 최적화
+    "reinforcement_learning": "Reinforcement Learning",
+    "efficient_ai": "Efficient AI",
+    # 응용 & 안전
+    "robotics": "Robotics & Embodied AI",
+    "scientific_ai": "Scientific AI",
+    "ai_safety": "AI Safety & Alignment",
+}
+
+# 분야별 키워드 (정밀한 검색을 위한 풍부한 키워드) — 불변 튜플로 고정
+_FIELD_KEYWORDS = {
+    # LLM & 추론
+    "llm_reasoning": ("large language model", "LLM", "GPT-4", "Claude", "Llama", "chain-of-thought", "reasoning", "in-context learning", "prompting", "instruction tuning"),
+    "ai_agents": ("AI agent", "autonomous agent", "tool use", "function calling", "multi-agent", "agent framework", "agentic", "planning agent"),
+    "code_generation": ("code generation", "code synthesis", "program synthesis", "Copilot", "code LLM", "automated programming", "code completion"),
+    "rag_knowledge": ("retrieval augmented", "RAG", "knowledge retrieval", "dense retrieval", "vector database", "knowledge base", "embedding retrieval"),
+    # 비전 & 멀티모달
+    "computer_vision": ("computer vision", "object detection", "image segmentation", "image classification", "visual recognition", "ViT", "CNN", "YOLO"),
+    "vision_language": ("vision-language", "VLM", "GPT-4V", "multimodal LLM", "CLIP", "image-text", "visual question answering", "image captioning"),
+    "video_world": ("video generation", "world model", "Sora", "video understanding", "temporal modeling", "video prediction", "spatiotemporal"),
+    "3d_spatial": ("3D reconstruction", "NeRF", "Gaussian splatting", "3D generation", "point cloud", "depth estimation", "3D vision", "spatial AI"),
+    # 생성 모델
+    "image_generation": ("diffusion model", "image generation", "text-to-image", "Stable Diffusion", "DALL-E", "image synthesis", "generative model"),
+    "audio_speech": ("text-to-speech", "TTS", "speech recognition", "ASR", "audio generation", "voice synthesis", "speech synthesis", "audio LLM"),
+    # 학습 & 최적화
+    "reinforcement_learning": ("reinforcement learning", "RL", "RLHF", "policy optimization", "reward model", "PPO", "decision making", "offline RL"),
+    "efficient_ai": ("model compression", "quantization", "pruning", "distillation", "efficient inference", "lightweight model", "edge AI", "PEFT", "LoRA"),
+    # 응용 & 안전
+    "robotics": ("robotics", "robot learning", "manipulation", "navigation", "embodied AI", "robot control", "autonomous robot"),
+    "scientific_ai": ("AI for science", "AlphaFold", "protein structure", "drug discovery", "molecular generation", "scientific discovery", "chemistry AI"),
+    "ai_safety": ("AI safety", "alignment", "RLHF", "red teaming", "jailbreak", "constitutional AI", "interpretability", "explainable AI", "fairness"),
+}
+_DEFAULT_FIELD_KEYWORDS = ("machine learning", "deep learning")
+
+# 소스별 초당 요청 한도 (보수적으로 설정, 미등록 소스는 _DEFAULT_SOURCE_RATE)
+_SOURCE_RATES = {
+    "arXiv": 3,             # arXiv API 권장: 3초당 1회보다 훨씬 널널하지만 버스트 허용
+    "Semantic Scholar": 1,  # 비인증 한도가 가장 엄격함
+    "Papers With Code": 2,
+    "Hugging Face": 2,
+    "OpenAlex": 3,
+    "DBLP": 2,
+    "CrossRef": 2,
+    "Moonlight": 2,
+}
+_DEFAULT_SOURCE_RATE = 2
+
+# 소스 신뢰도 순위 — Moonlight > Hugging Face (미등록 소스는 맨 뒤)
+_SOURCE_PRIORITY = {
+    "Moonlight": 0,          # 한국어 논문 리뷰 큐레이션 (최우선)
+    "Hugging Face": 1,       # ML 커뮤니티 큐레이션
+}
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """HTTP 429 여부를 예외 타입 + 응답 코드로 판별 (메시지 문자열 검색 불필요)"""
+    if not isinstance(exc, requests.exceptions.HTTPError):
+        return False
+    response = getattr(exc, "response", None)
+    return response is not None and getattr(response, "status_code", None) == 429
+
+
+def _is_timeout_error(exc: Exception) -> bool:
+    """타임아웃/연결 오류 여부 (둘 다 잠시 후 재시도 가치가 있음)"""
+    return isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """예외에 딸린 응답의 Retry-After 헤더 값(초) — 없거나 초 단위가 아니면 None"""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    try:
+        retry_after = response.headers.get("Retry-After")
+    except Exception:
+        return None
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after)
+    return None
+
+
+class _TokenBucket:
+    """
+    소스별 토큰 버킷 레이트 리미터 (스레드 안전)
+
+    매 호출 뒤 고정 시간을 자는 대신, 최근에 쓰지 않은 소스는 바로
+    통과시키고 뜨거운 소스만 잔여 시간만큼 대기시킨다. 429를 받으면
+    충전 속도를 절반으로 줄이고(penalize), 성공할 때마다 원래 속도로
+    서서히 복원한다(recover).
+    """
+
+    _MIN_RATE = 0.2  # 아무리 페널티를 받아도 5초당 1회는 시도
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰이 생길 때까지 대기 후 하나 소비"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self):
+        """429 수신 시 충전 속도를 절반으로 (하한 _MIN_RATE)"""
+        with self._lock:
+            self.rate = max(self._MIN_RATE, self.rate / 2)
+
+    def recover(self):
+        """성공 시 충전 속도를 기본값 쪽으로 복원"""
+        with self._lock:
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate * 1.5)
+
 
 class PaperSource(ABC):
     """논문 소스 추상 클래스"""
@@ -49,12 +370,38 @@ class PaperSource(ABC):
         """논문 검색"""
         pass
 
+    def search_batch(
+        self,
+        categories: List[str],
+        keywords_map: Dict[str, List[str]],
+        count_per: int = 5
+    ) -> Dict[str, List[Dict]]:
+        """여러 카테고리를 한 번에 검색
+
+        기본 구현은 카테고리별 개별 호출. 목록형 소스는 이를 재정의해
+        HTTP 요청 한 번으로 전 카테고리를 커버한다.
+        """
+        return {
+            category: self.search(category, keywords_map.get(category) or [], count_per)
+            for category in categories
+        }
+
 
 class ArxivSource(PaperSource):
     """arXiv API를 통한 최신 논문 검색"""
 
     BASE_URL = "http://export.arxiv.org/api/query"
 
+    # 정규화된 태그 문자열 사전 계산 (항목마다 "atom:X" 접두사 해석 + ns 딕셔너리 조회 제거)
+    ATOM = "{http://www.w3.org/2005/Atom}"
+    T_ENTRY = ATOM + "entry"
+    T_TITLE = ATOM + "title"
+    T_SUMMARY = ATOM + "summary"
+    T_AUTHOR = ATOM + "author"
+    T_NAME = ATOM + "name"
+    T_PUBLISHED = ATOM + "published"
+    T_ID = ATOM + "id"
+
     # 분야별 arXiv 카테고리 매핑
     CATEGORY_MAP = {
         "Computer Vision": ["cs.CV", "cs.GR"],
@@ -79,61 +426,68 @@ class ArxivSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # arXiv 카테고리 가져오기
             arxiv_cats = self.CATEGORY_MAP.get(category, ["cs.LG", "cs.AI"])
             cat_query = " OR ".join([f"cat:{cat}" for cat in arxiv_cats])
 
             # 키워드 쿼리 (랜덤 선택으로 다양성 확보)
-            selected_keywords = random.sample(keywords, min(3, len(keywords)))
+            selected_keywords = rng.sample(keywords, min(3, len(keywords)))
             keyword_query = " OR ".join([f"all:{kw}" for kw in selected_keywords])
 
             # 날짜 기반 랜덤성 추가 (최근 7-30일 중 랜덤)
-            days_back = random.randint(1, 14)
+            days_back = rng.randint(1, 14)
 
             query = f"({cat_query}) AND ({keyword_query})"
 
             params = {
                 "search_query": query,
-                "start": random.randint(0, 20),  # 시작 위치 랜덤
+                "start": rng.randint(0, 20),  # 시작 위치 랜덤
                 "max_results": count * 2,  # 여유분 확보
-                "sortBy": random.choice(["submittedDate", "relevance", "lastUpdatedDate"]),
+                "sortBy": rng.choice(["submittedDate", "relevance", "lastUpdatedDate"]),
                 "sortOrder": "descending"
             }
 
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
 
-            papers = self._parse_response(response.text, category)
-            random.shuffle(papers)  # 결과 섞기
-            return papers[:count]
+            # .text의 str 디코딩을 거치지 않고 응답 바이트를 파서에 바로 전달
+            papers = self._parse_response(response.content, category)
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"arXiv 검색 실패: {e}")
             return []
 
-    def _parse_response(self, xml_text: str, category: str) -> List[Dict]:
+    def _parse_response(self, xml_bytes: bytes, category: str) -> List[Dict]:
         papers = []
-        root = ET.fromstring(xml_text)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
+        if isinstance(xml_bytes, str):
+            xml_bytes = xml_bytes.encode()
 
-        for entry in root.findall("atom:entry", ns):
+        # 전체 DOM을 먼저 만들지 않고 <entry>가 닫힐 때마다 추출 후 바로 해제
+        # (max_results가 클 때 피크 메모리를 항목 수와 무관하게 유지)
+        for _event, entry in ET.iterparse(BytesIO(xml_bytes), events=("end",)):
+            if entry.tag != self.T_ENTRY:
+                continue
             try:
-                title = entry.find("atom:title", ns).text.strip().replace("\n", " ")
-                summary = entry.find("atom:summary", ns).text.strip().replace("\n", " ")
+                # strip+replace 2회 스캔 대신 한 번에 공백 정규화 (연속 공백도 제거)
+                title = " ".join(entry.find(self.T_TITLE).text.split())
+                summary = " ".join(entry.find(self.T_SUMMARY).text.split())
 
                 # 저자 정보
                 authors = []
-                for author in entry.findall("atom:author", ns):
-                    name = author.find("atom:name", ns)
+                for author in entry.findall(self.T_AUTHOR):
+                    name = author.find(self.T_NAME)
                     if name is not None:
                         authors.append(name.text)
 
                 # 발행일
-                published = entry.find("atom:published", ns).text[:10]
+                published = entry.find(self.T_PUBLISHED).text[:10]
                 year = int(published[:4])
 
                 # arXiv ID
-                arxiv_id = entry.find("atom:id", ns).text.split("/abs/")[-1]
+                arxiv_id = entry.find(self.T_ID).text.split("/abs/")[-1]
 
                 # PDF 링크
                 pdf_link = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
@@ -152,7 +506,12 @@ class ArxivSource(PaperSource):
                 })
             except Exception as e:
                 logger.debug(f"arXiv 항목 파싱 실패: {e}")
-                continue
+            finally:
+                entry.clear()
+                if LXML_AVAILABLE:
+                    # 처리한 entry의 앞선 형제들까지 트리에서 제거 (lxml 전용 API)
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
 
         return papers
 
@@ -183,14 +542,22 @@ class SemanticScholarSource(PaperSource):
     def description(self) -> str:
         return "인용수 및 영향력 정보 포함"
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _all_keywords(category: str, keywords_tuple: tuple) -> tuple:
+        """카테고리 키워드 + 사용자 키워드 합집합 (동일 조합 반복 시 재계산 방지)"""
+        cat_keywords = SemanticScholarSource.CATEGORY_KEYWORDS.get(category, ["machine learning"])
+        # dict.fromkeys: 중간 set 없이 한 번에 중복 제거 + 입력 순서 유지 (시드된 샘플링이 재현 가능)
+        return tuple(dict.fromkeys([*keywords_tuple, *cat_keywords]))
+
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 카테고리 키워드 + 사용자 키워드 조합
-            cat_keywords = self.CATEGORY_KEYWORDS.get(category, ["machine learning"])
-            all_keywords = list(set(keywords + cat_keywords))
+            all_keywords = self._all_keywords(category, tuple(keywords))
 
             # 랜덤 키워드 조합으로 다양성 확보
-            selected = random.sample(all_keywords, min(3, len(all_keywords)))
+            selected = rng.sample(all_keywords, min(3, len(all_keywords)))
             query = " ".join(selected)
 
             # 연도 필터 (최근 1-2년)
@@ -200,20 +567,20 @@ class SemanticScholarSource(PaperSource):
             params = {
                 "query": query,
                 "limit": count * 2,
-                "offset": random.randint(0, 10),
+                "offset": rng.randint(0, 10),
                 "fields": "title,authors,year,abstract,citationCount,url,externalIds,venue",
                 "year": year_filter,
             }
 
             headers = {"Accept": "application/json"}
 
-            response = requests.get(self.BASE_URL, params=params, headers=headers, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, headers=headers, timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             papers = self._parse_response(data.get("data", []), category)
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"Semantic Scholar 검색 실패: {e}")
@@ -221,28 +588,29 @@ class SemanticScholarSource(PaperSource):
 
     def _parse_response(self, data: List[Dict], category: str) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
 
-        for item in data:
-            try:
-                if not item.get("title"):
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in data:
+                if not isinstance(item, dict) or not item.get("title"):
                     continue
 
-                authors = [a.get("name", "") for a in item.get("authors", [])[:5]]
+                authors = [a.get("name", "") for a in (item.get("authors") or [])[:5]
+                           if isinstance(a, dict)]
 
                 # arXiv ID 또는 DOI
-                external_ids = item.get("externalIds", {})
+                external_ids = item.get("externalIds") or {}
                 arxiv_id = external_ids.get("ArXiv")
                 doi = external_ids.get("DOI")
 
-                pdf_url = None
-                if arxiv_id:
-                    pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+                pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf" if arxiv_id else None
 
                 papers.append({
                     "title": item.get("title", ""),
                     "authors": authors,
-                    "year": item.get("year", datetime.now().year),
-                    "abstract": item.get("abstract", "")[:500] if item.get("abstract") else "",
+                    "year": item.get("year") or current_year,
+                    "abstract": (item.get("abstract") or "")[:500],
                     "url": item.get("url", ""),
                     "pdf_url": pdf_url,
                     "source": "Semantic Scholar",
@@ -252,9 +620,8 @@ class SemanticScholarSource(PaperSource):
                     "arxiv_id": arxiv_id,
                     "doi": doi,
                 })
-            except Exception as e:
-                logger.debug(f"Semantic Scholar 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Semantic Scholar 응답 파싱 실패: {e}")
 
         return papers
 
@@ -274,38 +641,39 @@ class PapersWithCodeSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 트렌딩 논문 또는 키워드 검색
-            search_type = random.choice(["trending", "search"])
+            search_type = rng.choice(["trending", "search"])
 
             if search_type == "trending":
-                return self._get_trending(category, count)
+                return self._get_trending(category, count, rng)
             else:
-                return self._search_papers(category, keywords, count)
+                return self._search_papers(category, keywords, count, rng)
 
         except Exception as e:
             logger.warning(f"Papers With Code 검색 실패: {e}")
             return []
 
-    def _get_trending(self, category: str, count: int) -> List[Dict]:
+    def _get_trending(self, category: str, count: int, rng: random.Random) -> List[Dict]:
         """트렌딩 논문 가져오기"""
         url = f"{self.BASE_URL}/papers/"
         params = {
             "ordering": "-trending_score",
-            "page": random.randint(1, 3),
+            "page": rng.randint(1, 3),
             "items_per_page": count * 2,
         }
 
-        response = requests.get(url, params=params, timeout=15)
+        response = _cached_get(url, params=params, timeout=15)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
         return self._parse_response(data.get("results", []), category)[:count]
 
-    def _search_papers(self, category: str, keywords: List[str], count: int) -> List[Dict]:
+    def _search_papers(self, category: str, keywords: List[str], count: int, rng: random.Random) -> List[Dict]:
         """키워드 검색"""
         url = f"{self.BASE_URL}/papers/"
 
-        selected = random.sample(keywords, min(2, len(keywords)))
+        selected = rng.sample(keywords, min(2, len(keywords)))
         query = " ".join(selected)
 
         params = {
@@ -314,24 +682,29 @@ class PapersWithCodeSource(PaperSource):
             "items_per_page": count * 2,
         }
 
-        response = requests.get(url, params=params, timeout=15)
+        response = _cached_get(url, params=params, timeout=15)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
         papers = self._parse_response(data.get("results", []), category)
-        random.shuffle(papers)
-        return papers[:count]
+        # 전체 셔플 대신 O(count) 샘플링
+        return rng.sample(papers, min(count, len(papers)))
 
     def _parse_response(self, data: List[Dict], category: str) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
 
-        for item in data:
-            try:
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                authors = item.get("authors")
                 papers.append({
                     "title": item.get("title", ""),
-                    "authors": item.get("authors", [])[:5] if isinstance(item.get("authors"), list) else [],
-                    "year": self._extract_year(item.get("published", "")),
-                    "abstract": item.get("abstract", "")[:500] if item.get("abstract") else "",
+                    "authors": authors[:5] if isinstance(authors, list) else [],
+                    "year": self._extract_year(item.get("published", ""), current_year),
+                    "abstract": (item.get("abstract") or "")[:500],
                     "url": item.get("url_abs", "") or item.get("paper_url", ""),
                     "pdf_url": item.get("url_pdf", ""),
                     "source": "Papers With Code",
@@ -340,19 +713,18 @@ class PapersWithCodeSource(PaperSource):
                     "code_url": item.get("proceeding", ""),
                     "has_code": True,
                 })
-            except Exception as e:
-                logger.debug(f"Papers With Code 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Papers With Code 응답 파싱 실패: {e}")
 
         return papers
 
-    def _extract_year(self, date_str: str) -> int:
+    def _extract_year(self, date_str: str, default_year: int) -> int:
         if not date_str:
-            return datetime.now().year
+            return default_year
         try:
             return int(date_str[:4])
         except:
-            return datetime.now().year
+            return default_year
 
 
 class HuggingFacePapersSource(PaperSource):
@@ -370,64 +742,92 @@ class HuggingFacePapersSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 최근 며칠 중 랜덤 선택
-            days_back = random.randint(0, 7)
+            days_back = rng.randint(0, 7)
             target_date = datetime.now() - timedelta(days=days_back)
             date_str = target_date.strftime("%Y-%m-%d")
 
-            response = requests.get(f"{self.BASE_URL}?date={date_str}", timeout=15)
+            response = _cached_get(f"{self.BASE_URL}?date={date_str}", timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             papers = self._parse_response(data, category, keywords)
 
             # 키워드 관련성으로 필터링
             if keywords:
                 papers = self._filter_by_keywords(papers, keywords)
 
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"Hugging Face 검색 실패: {e}")
             return []
 
+    def search_batch(
+        self,
+        categories: List[str],
+        keywords_map: Dict[str, List[str]],
+        count_per: int = 5
+    ) -> Dict[str, List[Dict]]:
+        """일간 목록을 한 번만 받아 카테고리별로 분배 (카테고리당 요청 불필요)"""
+        try:
+            rng = _daily_rng("batch")
+            days_back = rng.randint(0, 7)
+            date_str = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+            response = _cached_get(f"{self.BASE_URL}?date={date_str}", timeout=15)
+            response.raise_for_status()
+
+            papers = self._parse_response(_decode_json(response), "", [])
+            return _split_by_categories(papers, categories, keywords_map, count_per)
+
+        except Exception as e:
+            logger.warning(f"Hugging Face 배치 검색 실패: {e}")
+            return {}
+
     def _parse_response(self, data: List[Dict], category: str, keywords: List[str]) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
 
-        for item in data:
-            try:
-                paper_info = item.get("paper", {})
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                paper_info = item.get("paper") or {}
+                title = paper_info.get("title", "")
+                abstract = (paper_info.get("summary") or "")[:500]
 
                 papers.append({
-                    "title": paper_info.get("title", ""),
-                    "authors": [a.get("name", "") for a in paper_info.get("authors", [])[:5]],
-                    "year": datetime.now().year,
-                    "abstract": paper_info.get("summary", "")[:500] if paper_info.get("summary") else "",
+                    "title": title,
+                    "authors": [a.get("name", "") for a in (paper_info.get("authors") or [])[:5]
+                                if isinstance(a, dict)],
+                    "year": current_year,
+                    "abstract": abstract,
+                    # 키워드 필터가 매번 .lower()를 반복하지 않도록 파싱 시 1회 계산
+                    "_searchable": f"{title} {abstract}".lower(),
                     "url": f"https://huggingface.co/papers/{paper_info.get('id', '')}",
                     "pdf_url": "",
                     "source": "Hugging Face",
                     "citations": item.get("numComments", 0),
                     "searched_category": category,
-                    "upvotes": item.get("paper", {}).get("upvotes", 0),
+                    "upvotes": paper_info.get("upvotes", 0),
                 })
-            except Exception as e:
-                logger.debug(f"Hugging Face 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Hugging Face 응답 파싱 실패: {e}")
 
         return papers
 
     def _filter_by_keywords(self, papers: List[Dict], keywords: List[str]) -> List[Dict]:
         """키워드 관련성으로 필터링"""
-        keyword_lower = [kw.lower() for kw in keywords]
+        pattern = _keyword_pattern(keywords)
 
         scored_papers = []
         for paper in papers:
-            title_lower = paper.get("title", "").lower()
-            abstract_lower = paper.get("abstract", "").lower()
-
-            score = sum(1 for kw in keyword_lower if kw in title_lower or kw in abstract_lower)
-            scored_papers.append((score, paper))
+            text = paper.get("_searchable") or f"{paper.get('title', '')} {paper.get('abstract', '')}".lower()
+            scored_papers.append((_keyword_score(pattern, text), paper))
 
         # 점수순 정렬 후 반환
         scored_papers.sort(key=lambda x: x[0], reverse=True)
@@ -462,29 +862,30 @@ class OpenAlexSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 최근 논문 필터
             current_year = datetime.now().year
             from_date = f"{current_year - 1}-01-01"
 
             # 키워드 검색 쿼리
-            selected = random.sample(keywords, min(3, len(keywords)))
+            selected = rng.sample(keywords, min(3, len(keywords)))
             search_query = " ".join(selected)
 
             params = {
                 "search": search_query,
                 "filter": f"from_publication_date:{from_date},type:article",
-                "sort": random.choice(["cited_by_count:desc", "publication_date:desc", "relevance_score:desc"]),
+                "sort": rng.choice(["cited_by_count:desc", "publication_date:desc", "relevance_score:desc"]),
                 "per_page": count * 2,
-                "page": random.randint(1, 3),
+                "page": rng.randint(1, 3),
             }
 
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             papers = self._parse_response(data.get("results", []), category)
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"OpenAlex 검색 실패: {e}")
@@ -492,40 +893,39 @@ class OpenAlexSource(PaperSource):
 
     def _parse_response(self, data: List[Dict], category: str) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
+
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
 
-        for item in data:
-            try:
                 # 저자 정보
                 authors = []
-                for authorship in item.get("authorships", [])[:5]:
-                    author = authorship.get("author", {})
-                    if author.get("display_name"):
+                for authorship in (item.get("authorships") or [])[:5]:
+                    author = authorship.get("author") if isinstance(authorship, dict) else None
+                    if author and author.get("display_name"):
                         authors.append(author["display_name"])
 
-                # 발행 연도
-                year = item.get("publication_year", datetime.now().year)
-
                 # PDF URL (Open Access인 경우)
-                pdf_url = None
-                oa_info = item.get("open_access", {})
-                if oa_info.get("is_oa"):
-                    pdf_url = oa_info.get("oa_url")
+                oa_info = item.get("open_access") or {}
+                pdf_url = oa_info.get("oa_url") if oa_info.get("is_oa") else None
 
                 papers.append({
                     "title": item.get("title", ""),
                     "authors": authors,
-                    "year": year,
+                    "year": item.get("publication_year") or current_year,
                     "abstract": "",  # OpenAlex는 abstract가 별도 요청 필요
-                    "url": item.get("id", "").replace("https://openalex.org/", "https://openalex.org/works/"),
+                    "url": (item.get("id") or "").replace("https://openalex.org/", "https://openalex.org/works/"),
                     "pdf_url": pdf_url,
                     "source": "OpenAlex",
                     "citations": item.get("cited_by_count", 0),
                     "searched_category": category,
                     "doi": item.get("doi", ""),
                 })
-            except Exception as e:
-                logger.debug(f"OpenAlex 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"OpenAlex 응답 파싱 실패: {e}")
 
         return papers
 
@@ -545,26 +945,27 @@ class DBLPSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 키워드 조합
-            selected = random.sample(keywords, min(3, len(keywords)))
+            selected = rng.sample(keywords, min(3, len(keywords)))
             query = " ".join(selected)
 
             params = {
                 "q": query,
                 "format": "json",
                 "h": count * 2,
-                "f": random.randint(0, 20),
+                "f": rng.randint(0, 20),
             }
 
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             hits = data.get("result", {}).get("hits", {}).get("hit", [])
 
             papers = self._parse_response(hits, category)
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"DBLP 검색 실패: {e}")
@@ -572,13 +973,18 @@ class DBLPSource(PaperSource):
 
     def _parse_response(self, hits: List[Dict], category: str) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
 
-        for hit in hits:
-            try:
-                info = hit.get("info", {})
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for hit in hits:
+                if not isinstance(hit, dict):
+                    continue
+                info = hit.get("info") or {}
 
                 # 저자 처리 (단일 또는 다중)
-                authors_raw = info.get("authors", {}).get("author", [])
+                authors_field = info.get("authors")
+                authors_raw = authors_field.get("author", []) if isinstance(authors_field, dict) else []
                 if isinstance(authors_raw, str):
                     authors = [authors_raw]
                 elif isinstance(authors_raw, list):
@@ -587,7 +993,8 @@ class DBLPSource(PaperSource):
                     authors = []
 
                 # 연도 추출
-                year = int(info.get("year", datetime.now().year))
+                year_raw = str(info.get("year", ""))
+                year = int(year_raw) if year_raw.isdigit() else current_year
 
                 papers.append({
                     "title": info.get("title", ""),
@@ -601,9 +1008,8 @@ class DBLPSource(PaperSource):
                     "searched_category": category,
                     "venue": info.get("venue", ""),
                 })
-            except Exception as e:
-                logger.debug(f"DBLP 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"DBLP 응답 파싱 실패: {e}")
 
         return papers
 
@@ -623,7 +1029,8 @@ class CrossRefSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
-            selected = random.sample(keywords, min(3, len(keywords)))
+            rng = _daily_rng(category)
+            selected = rng.sample(keywords, min(3, len(keywords)))
             query = " ".join(selected)
 
             # 최근 연도 필터
@@ -632,22 +1039,22 @@ class CrossRefSource(PaperSource):
             params = {
                 "query": query,
                 "rows": count * 2,
-                "offset": random.randint(0, 20),
+                "offset": rng.randint(0, 20),
                 "filter": f"from-pub-date:{current_year - 1}",
-                "sort": random.choice(["relevance", "published", "is-referenced-by-count"]),
+                "sort": rng.choice(["relevance", "published", "is-referenced-by-count"]),
             }
 
             headers = {"User-Agent": "TistoryAutoPoster/1.0 (mailto:example@example.com)"}
 
-            response = requests.get(self.BASE_URL, params=params, headers=headers, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, headers=headers, timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             items = data.get("message", {}).get("items", [])
 
             papers = self._parse_response(items, category)
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"CrossRef 검색 실패: {e}")
@@ -655,44 +1062,51 @@ class CrossRefSource(PaperSource):
 
     def _parse_response(self, items: List[Dict], category: str) -> List[Dict]:
         papers = []
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
+
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
 
-        for item in items:
-            try:
                 # 제목 추출
-                title_list = item.get("title", [])
+                title_list = item.get("title") or []
                 title = title_list[0] if title_list else ""
 
                 # 저자 추출
                 authors = []
-                for author in item.get("author", [])[:5]:
+                for author in (item.get("author") or [])[:5]:
+                    if not isinstance(author, dict):
+                        continue
                     name = f"{author.get('given', '')} {author.get('family', '')}".strip()
                     if name:
                         authors.append(name)
 
                 # 연도 추출
-                pub_date = item.get("published", {}).get("date-parts", [[datetime.now().year]])
-                year = pub_date[0][0] if pub_date and pub_date[0] else datetime.now().year
+                pub_date = (item.get("published") or {}).get("date-parts") or [[current_year]]
+                year = pub_date[0][0] if pub_date and pub_date[0] else current_year
 
                 # DOI 및 URL
                 doi = item.get("DOI", "")
                 url = f"https://doi.org/{doi}" if doi else ""
 
+                container_title = item.get("container-title") or [""]
                 papers.append({
                     "title": title,
                     "authors": authors,
                     "year": year,
-                    "abstract": item.get("abstract", "")[:500] if item.get("abstract") else "",
+                    "abstract": (item.get("abstract") or "")[:500],
                     "url": url,
                     "pdf_url": "",
                     "source": "CrossRef",
                     "citations": item.get("is-referenced-by-count", 0),
                     "searched_category": category,
                     "doi": doi,
-                    "venue": item.get("container-title", [""])[0] if item.get("container-title") else "",
+                    "venue": container_title[0] if container_title else "",
                 })
-            except Exception as e:
-                logger.debug(f"CrossRef 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"CrossRef 응답 파싱 실패: {e}")
 
         return papers
 
@@ -702,6 +1116,9 @@ class MoonlightSource(PaperSource):
 
     BASE_URL = "https://www.themoonlight.io/api/review/latest"
 
+    # URL에서 arXiv ID 추출 (버전 접미사는 v10+까지 정확히 제거)
+    _ARXIV_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})(?:v\d+)?")
+
     # 분야 코드 매핑
     CATEGORY_MAP = {
         "Computer Vision": "cs",
@@ -736,87 +1153,117 @@ class MoonlightSource(PaperSource):
 
     def search(self, category: str, keywords: List[str], count: int = 5) -> List[Dict]:
         try:
+            rng = _daily_rng(category)
             # 카테고리 매핑 (대부분 cs)
             moonlight_cat = self.CATEGORY_MAP.get(category, "cs")
 
             params = {
                 "limit": count * 3,  # 여유분 확보
-                "offset": random.randint(0, 20),  # 다양성을 위한 오프셋
+                "offset": rng.randint(0, 20),  # 다양성을 위한 오프셋
                 "language": "ko",
                 "category": moonlight_cat,
             }
 
-            response = requests.get(self.BASE_URL, params=params, timeout=15)
+            response = _cached_get(self.BASE_URL, params=params, timeout=15)
             response.raise_for_status()
 
-            data = response.json()
+            data = _decode_json(response)
             papers = self._parse_response(data.get("results", []), category, keywords)
 
             # 키워드 관련성으로 필터링
             if keywords:
                 papers = self._filter_by_keywords(papers, keywords)
 
-            random.shuffle(papers)
-            return papers[:count]
+            # 전체 셔플 대신 O(count) 샘플링
+            return rng.sample(papers, min(count, len(papers)))
 
         except Exception as e:
             logger.warning(f"Moonlight 검색 실패: {e}")
             return []
 
+    def search_batch(
+        self,
+        categories: List[str],
+        keywords_map: Dict[str, List[str]],
+        count_per: int = 5
+    ) -> Dict[str, List[Dict]]:
+        """최신 리뷰 목록을 한 번만 받아 카테고리별로 분배 (카테고리당 요청 불필요)"""
+        try:
+            rng = _daily_rng("batch")
+            params = {
+                # 전 카테고리를 한 풀에서 나눠 갖도록 넉넉히 (API 보호를 위해 상한)
+                "limit": min(100, count_per * len(categories) * 2),
+                "offset": rng.randint(0, 20),
+                "language": "ko",
+                "category": "cs",  # CATEGORY_MAP상 전 카테고리가 cs
+            }
+
+            response = _cached_get(self.BASE_URL, params=params, timeout=15)
+            response.raise_for_status()
+
+            data = _decode_json(response)
+            papers = self._parse_response(data.get("results", []), "", [])
+            return _split_by_categories(papers, categories, keywords_map, count_per)
+
+        except Exception as e:
+            logger.warning(f"Moonlight 배치 검색 실패: {e}")
+            return {}
+
     def _parse_response(self, data: List[Dict], category: str, keywords: List[str]) -> List[Dict]:
         papers = []
 
-        for item in data:
-            try:
+        current_year = datetime.now().year  # 항목마다 시계 조회하지 않도록 호이스팅
+
+        # 항목별 try/except 대신 .get 기본값으로 방어 (예외 기계 비용 제거)
+        try:
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+
                 # 발행일 파싱
-                pub_date = item.get("published_date", "")
-                year = datetime.now().year
-                if pub_date:
-                    try:
-                        year = int(pub_date[:4])
-                    except:
-                        pass
+                pub_date = item.get("published_date") or ""
+                year = int(pub_date[:4]) if pub_date[:4].isdigit() else current_year
 
                 # arXiv ID 추출 (URL에서)
-                url = item.get("url", "")
-                arxiv_id = ""
-                if "arxiv.org" in url:
-                    arxiv_id = url.split("/")[-1].replace("v1", "").replace("v2", "")
+                url = item.get("url") or ""
+                m = self._ARXIV_RE.search(url)
+                arxiv_id = m.group(1) if m else ""
+
+                title = item.get("title", "")
+                abstract = (item.get("summary") or "")[:500]
+                keywords_short = item.get("keywords_short", "")
 
                 papers.append({
-                    "title": item.get("title", ""),
-                    "authors": item.get("authors", [])[:5],
+                    "title": title,
+                    "authors": (item.get("authors") or [])[:5],
                     "year": year,
-                    "abstract": item.get("summary", "")[:500] if item.get("summary") else "",
+                    "abstract": abstract,
+                    # 키워드 필터가 매번 .lower()를 반복하지 않도록 파싱 시 1회 계산
+                    "_searchable": f"{title} {abstract} {keywords_short}".lower(),
                     "url": url,
                     "pdf_url": item.get("pdf_url", ""),
                     "source": "Moonlight",
                     "citations": 0,
                     "searched_category": category,
                     "arxiv_id": arxiv_id,
-                    "keywords_short": item.get("keywords_short", ""),
+                    "keywords_short": keywords_short,
                     "moonlight_slug": item.get("slug", ""),
                     "moonlight_url": f"https://www.themoonlight.io/ko/review/{item.get('slug', '')}",
                 })
-            except Exception as e:
-                logger.debug(f"Moonlight 항목 파싱 실패: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Moonlight 응답 파싱 실패: {e}")
 
         return papers
 
     def _filter_by_keywords(self, papers: List[Dict], keywords: List[str]) -> List[Dict]:
         """키워드 관련성으로 필터링"""
-        keyword_lower = [kw.lower() for kw in keywords]
+        pattern = _keyword_pattern(keywords)
 
         scored_papers = []
         for paper in papers:
-            title_lower = paper.get("title", "").lower()
-            abstract_lower = paper.get("abstract", "").lower()
-            keywords_short = paper.get("keywords_short", "").lower()
-
-            score = sum(1 for kw in keyword_lower
-                       if kw in title_lower or kw in abstract_lower or kw in keywords_short)
-            scored_papers.append((score, paper))
+            text = paper.get("_searchable") or (f"{paper.get('title', '')} {paper.get('abstract', '')} "
+                                                f"{paper.get('keywords_short', '')}").lower()
+            scored_papers.append((_keyword_score(pattern, text), paper))
 
         # 점수순 정렬 후 반환
         scored_papers.sort(key=lambda x: x[0], reverse=True)
@@ -846,6 +1293,23 @@ class PaperSearcher:
         # 검색 히스토리 (중복 방지용)
         self.search_history: Dict[str, set] = {}
 
+        # 소스 병렬 호출용 스레드풀 (검색마다 풀을 새로 만들지 않도록 재사용)
+        self._executor = ThreadPoolExecutor(max_workers=max(4, len(self.sources)))
+
+        # 소스별 토큰 버킷 — 고정 sleep 대신 실제 요청 속도만 제한
+        self._rate_limits: Dict[str, _TokenBucket] = {
+            source.name: _TokenBucket(rate=_SOURCE_RATES.get(source.name, _DEFAULT_SOURCE_RATE))
+            for source in self.sources
+        }
+
+        # 신뢰도 순 정렬은 소스 목록이 바뀌지 않는 한 불변이므로 한 번만 계산
+        self._priority_sources = tuple(
+            sorted(self.sources, key=lambda s: _SOURCE_PRIORITY.get(s.name, 99))
+        )
+
+        # 이름 → 소스 조회 테이블 (search_single_source의 선형 탐색 대체)
+        self._source_by_name = {source.name: source for source in self.sources}
+
     def get_available_sources(self) -> List[str]:
         """사용 가능한 소스 목록 반환"""
         return [source.name for source in self.sources]
@@ -873,60 +1337,91 @@ class PaperSearcher:
         Returns:
             논문 정보 리스트
         """
-        exclude_titles = set(t.lower() for t in (exclude_titles or []))
+        # 제외 제목 + 논문 식별 키(arxiv_id/doi/제목 해시)를 한 집합으로 관리
+        seen = set(t.lower() for t in (exclude_titles or []))
 
         all_papers = []
         used_sources = []
         failed_sources = set()
+        attempted_sources = set()
+        requeued_sources = set()  # 429로 뒤로 미룬 소스 (무한 재시도 방지용 1회 한정)
 
         # 신뢰도 순으로 정렬된 소스 목록
-        priority_sources = self._get_priority_sources()
+        priority_sources = self._priority_sources
 
         # 초기 소스 선택
-        selected_sources = self._select_sources(source_count)
-        sources_to_try = list(selected_sources)
-
-        max_attempts = len(self.sources) if retry_on_failure else source_count
-        attempt = 0
-
-        while len(all_papers) < count and attempt < max_attempts:
-            attempt += 1
-
-            # 시도할 소스가 없으면 우선순위 소스에서 추가
-            if not sources_to_try:
-                for src in priority_sources:
-                    if src.name not in failed_sources and src.name not in used_sources:
-                        sources_to_try.append(src)
-                        break
+        sources_to_try = list(self._select_sources(source_count))
 
-            if not sources_to_try:
-                break  # 더 이상 시도할 소스 없음
+        while len(all_papers) < count and sources_to_try:
+            # 이번 웨이브에서 시도할 소스 (이미 시도한 소스는 제외)
+            wave = [s for s in sources_to_try if s.name not in attempted_sources]
+            sources_to_try = []
 
-            source = sources_to_try.pop(0)
-
-            # 이미 실패한 소스는 건너뛰기
-            if source.name in failed_sources:
-                continue
+            if not wave:
+                break
 
             # 필요한 논문 수 계산
             needed = count - len(all_papers)
             per_source = max(2, needed + 1)  # 여유분 확보
 
-            try:
-                logger.info(f"[{source.name}] 검색 시도 중...")
-                papers = source.search(category, keywords, per_source)
+            # 소스별 호출은 서로 다른 API라 독립적이므로 동시에 요청
+            # (순차 대비 전체 지연이 소스 지연의 합 → 최대값으로 감소)
+            wave_results: List[List[Dict]] = [[] for _ in wave]
+            logger.info(f"검색 시도 중: {[s.name for s in wave]}")
 
-                if papers:
-                    # 중복 제거
-                    for paper in papers:
-                        title_lower = paper.get("title", "").lower()
-                        if title_lower and title_lower not in exclude_titles:
-                            if not any(p.get("title", "").lower() == title_lower for p in all_papers):
-                                all_papers.append(paper)
-                                exclude_titles.add(title_lower)
+            futures = {
+                self._executor.submit(self._rate_limited_search, source, category, keywords, per_source): idx
+                for idx, source in enumerate(wave)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                source = wave[idx]
+                attempted_sources.add(source.name)
+                try:
+                    wave_results[idx] = future.result()
+                except Exception as e:
+                    if _is_rate_limit_error(e):
+                        # 백오프 재시도까지 전부 막힌 상태 — 죽은 게 아니라 뜨거운
+                        # 것이므로 한 번은 대기열 맨 뒤로 미뤄 기회를 더 준다
+                        if retry_on_failure and source.name not in requeued_sources:
+                            requeued_sources.add(source.name)
+                            attempted_sources.discard(source.name)
+                            sources_to_try.append(source)
+                            logger.warning(f"[{source.name}] 레이트 리밋 초과, 대기열 뒤로 이동")
+                        else:
+                            logger.warning(f"[{source.name}] 레이트 리밋 초과, 다른 소스 시도")
+                            failed_sources.add(source.name)
+                    else:
+                        if _is_timeout_error(e):
+                            logger.warning(f"[{source.name}] 타임아웃, 다른 소스 시도")
+                        else:
+                            logger.warning(f"[{source.name}] 검색 실패: {type(e).__name__}: {e}")
+                        failed_sources.add(source.name)
+
+            # 선택 순서대로 병합 (중복 제거 결과가 완료 순서에 좌우되지 않도록)
+            for idx, source in enumerate(wave):
+                # 실패했거나 429로 다음 웨이브로 미뤄진 소스는 건너뜀
+                if source.name in failed_sources or source.name not in attempted_sources:
+                    continue
 
-                                if len(all_papers) >= count:
-                                    break
+                papers = wave_results[idx]
+                if papers:
+                    # 중복 제거 — 소스마다 제목 표기가 달라도 같은 arXiv ID/DOI면 같은 논문
+                    # 키 계산은 일괄 컴프리헨션으로 루프 밖으로 빼고, 조건부에는 집합 조회만 남김
+                    candidates = [
+                        (paper, _title_key(paper),
+                         paper.get("arxiv_id") or paper.get("doi")
+                         or hashlib.blake2b(_title_key(paper).encode(), digest_size=8).digest())
+                        for paper in papers
+                    ]
+                    for paper, title_lower, key in candidates:
+                        if title_lower and title_lower not in seen and key not in seen:
+                            all_papers.append(paper)
+                            seen.add(title_lower)
+                            seen.add(key)
+
+                            if len(all_papers) >= count:
+                                break
 
                     used_sources.append(source.name)
                     logger.info(f"[{source.name}] {len(papers)}개 논문 검색 성공")
@@ -934,20 +1429,13 @@ class PaperSearcher:
                     logger.warning(f"[{source.name}] 검색 결과 없음")
                     failed_sources.add(source.name)
 
-            except Exception as e:
-                error_msg = str(e)
-                if "429" in error_msg:
-                    logger.warning(f"[{source.name}] 레이트 리밋 초과, 다른 소스 시도")
-                elif "timeout" in error_msg.lower():
-                    logger.warning(f"[{source.name}] 타임아웃, 다른 소스 시도")
-                else:
-                    logger.warning(f"[{source.name}] 검색 실패: {e}")
-
-                failed_sources.add(source.name)
-                continue
-
-            # API 레이트 리밋 방지
-            time.sleep(0.3)
+            # 부족하면 아직 시도하지 않은 우선순위 소스로 재시도
+            if len(all_papers) < count and retry_on_failure:
+                queued_names = {s.name for s in sources_to_try}
+                for src in priority_sources:
+                    if src.name not in attempted_sources and src.name not in queued_names:
+                        sources_to_try.append(src)
+                        break
 
         # 결과 섞기 및 개수 제한
         random.shuffle(all_papers)
@@ -964,35 +1452,89 @@ class PaperSearcher:
 
         return result
 
-    def _select_sources(self, count: int) -> List[PaperSource]:
-        """가중치 기반으로 소스 랜덤 선택"""
-        # 가중치 리스트 생성
-        weighted_sources = []
-        for source in self.sources:
-            weight = self.source_weights.get(source.name, 1)
-            weighted_sources.extend([source] * weight)
-
-        # 랜덤 선택 (중복 방지)
-        selected = []
-        available = list(set(weighted_sources))
-        random.shuffle(available)
-
-        for source in available:
-            if len(selected) >= count:
-                break
-            if source not in selected:
-                selected.append(source)
+    def _rate_limited_search(
+        self,
+        source: PaperSource,
+        category: str,
+        keywords: List[str],
+        count: int,
+        max_tries: int = 3
+    ) -> List[Dict]:
+        """
+        소스별 토큰 버킷을 통과한 뒤 검색
 
-        return selected
+        429/타임아웃은 일시적인 경우가 많으므로 지터를 더한 지수 백오프로
+        max_tries회까지 재시도하고, 서버가 Retry-After를 보내면 그 값을
+        우선한다. 429 시 버킷 충전 속도를 감속하고 성공 시 복원한다.
+        """
+        limiter = self._rate_limits.setdefault(
+            source.name,
+            _TokenBucket(rate=_SOURCE_RATES.get(source.name, _DEFAULT_SOURCE_RATE))
+        )
+
+        for attempt in range(max_tries):
+            limiter.acquire()
+            try:
+                papers = source.search(category, keywords, count)
+            except Exception as e:
+                is_rate_limited = _is_rate_limit_error(e)
+                if is_rate_limited:
+                    limiter.penalize()
+
+                # 429/타임아웃만 재시도 대상 (파싱 오류 등은 기다려도 안 바뀜)
+                if not (is_rate_limited or _is_timeout_error(e)):
+                    raise
+                if attempt >= max_tries - 1:
+                    raise
+
+                delay = min(8, 0.5 * 2 ** attempt) + random.random() * 0.25
+                retry_after = _retry_after_seconds(e)
+                if retry_after is not None:
+                    delay = min(30, retry_after)
+                logger.warning(f"[{source.name}] 일시적 오류, {delay:.1f}초 후 재시도 "
+                               f"({attempt + 1}/{max_tries - 1}): {type(e).__name__}: {str(e)[:80]}")
+                time.sleep(delay)
+                continue
+
+            limiter.recover()
+            return papers
+
+    def _rate_limited_batch(
+        self,
+        source: PaperSource,
+        categories: List[str],
+        keywords_map: Dict[str, List[str]],
+        count_per: int
+    ) -> Dict[str, List[Dict]]:
+        """소스별 토큰 버킷을 통과한 뒤 배치 검색 (429 시 감속, 성공 시 복원)"""
+        limiter = self._rate_limits.setdefault(
+            source.name,
+            _TokenBucket(rate=_SOURCE_RATES.get(source.name, _DEFAULT_SOURCE_RATE))
+        )
+        limiter.acquire()
+        try:
+            by_category = source.search_batch(categories, keywords_map, count_per)
+        except Exception as e:
+            if _is_rate_limit_error(e):
+                limiter.penalize()
+            raise
+        limiter.recover()
+        return by_category
+
+    def _select_sources(self, count: int) -> List[PaperSource]:
+        """가중치 기반으로 소스 랜덤 선택 (중복 없음)"""
+        # [source] * weight 확장 없이 가중치 비복원 추출
+        # (Efraimidis-Spirakis: random()^(1/w) 키가 큰 순서대로 k개)
+        ranked = sorted(
+            self.sources,
+            key=lambda s: random.random() ** (1 / self.source_weights.get(s.name, 1)),
+            reverse=True,
+        )
+        return ranked[:min(count, len(self.sources))]
 
     def _get_priority_sources(self) -> List[PaperSource]:
-        """신뢰도 순으로 정렬된 소스 목록 반환"""
-        # Moonlight > Hugging Face
-        priority_order = {
-            "Moonlight": 0,          # 한국어 논문 리뷰 큐레이션 (최우선)
-            "Hugging Face": 1,       # ML 커뮤니티 큐레이션
-        }
-        return sorted(self.sources, key=lambda s: priority_order.get(s.name, 99))
+        """신뢰도 순으로 정렬된 소스 목록 반환 (__init__에서 계산한 값)"""
+        return list(self._priority_sources)
 
     def search_single_source(
         self,
@@ -1002,12 +1544,11 @@ class PaperSearcher:
         count: int = 5
     ) -> List[Dict]:
         """특정 소스에서만 검색"""
-        for source in self.sources:
-            if source.name == source_name:
-                return source.search(category, keywords, count)
-
-        logger.warning(f"알 수 없는 소스: {source_name}")
-        return []
+        source = self._source_by_name.get(source_name)
+        if source is None:
+            logger.warning(f"알 수 없는 소스: {source_name}")
+            return []
+        return source.search(category, keywords, count)
 
     def get_diverse_papers(
         self,
@@ -1026,9 +1567,9 @@ class PaperSearcher:
         previous_titles = previous_titles or []
 
         # 날짜 기반 시드로 일관된 랜덤성
-        date_seed = datetime.now().strftime("%Y%m%d")
-        category_hash = hashlib.md5(category.encode()).hexdigest()[:8]
-        random.seed(f"{date_seed}_{category_hash}")
+        # (암호학적 해시/문자열 조립 대신 정수 시드 — crc32는 C 구현이라 훨씬 저렴)
+        date_seed = int(datetime.now().strftime("%Y%m%d"))
+        random.seed((date_seed << 32) ^ zlib.crc32(category.encode()))
 
         # 다양한 소스에서 검색
         papers = self.search(
@@ -1059,109 +1600,73 @@ class PaperSearcher:
         Returns:
             분야별 논문 리스트 딕셔너리
         """
-        # 분야 코드 → 카테고리 이름 매핑 (2024-2025 최신 트렌드 반영)
-        field_to_category = {
-            # LLM & 추론
-            "llm_reasoning": "LLM & Reasoning",
-            "ai_agents": "AI Agents",
-            "code_generation": "Code Generation",
-            "rag_knowledge": "RAG & Knowledge",
-            # 비전 & 멀티모달
-            "computer_vision": "Computer Vision",
-            "vision_language": "Vision-Language Models",
-            "video_world": "Video & World Models",
-            "3d_spatial": "3D & Spatial AI",
-            # 생성 모델
-            "image_generation": "Image Generation",
-            "audio_speech": "Audio & Speech",
-            # 학습 & 최적화
-            "reinforcement_learning": "Reinforcement Learning",
-            "efficient_ai": "Efficient AI",
-            # 응용 & 안전
-            "robotics": "Robotics & Embodied AI",
-            "scientific_ai": "Scientific AI",
-            "ai_safety": "AI Safety & Alignment",
-        }
-
-        # 분야별 키워드 (정밀한 검색을 위한 풍부한 키워드)
-        field_keywords = {
-            # LLM & 추론
-            "llm_reasoning": ["large language model", "LLM", "GPT-4", "Claude", "Llama", "chain-of-thought", "reasoning", "in-context learning", "prompting", "instruction tuning"],
-            "ai_agents": ["AI agent", "autonomous agent", "tool use", "function calling", "multi-agent", "agent framework", "agentic", "planning agent"],
-            "code_generation": ["code generation", "code synthesis", "program synthesis", "Copilot", "code LLM", "automated programming", "code completion"],
-            "rag_knowledge": ["retrieval augmented", "RAG", "knowledge retrieval", "dense retrieval", "vector database", "knowledge base", "embedding retrieval"],
-            # 비전 & 멀티모달
-            "computer_vision": ["computer vision", "object detection", "image segmentation", "image classification", "visual recognition", "ViT", "CNN", "YOLO"],
-            "vision_language": ["vision-language", "VLM", "GPT-4V", "multimodal LLM", "CLIP", "image-text", "visual question answering", "image captioning"],
-            "video_world": ["video generation", "world model", "Sora", "video understanding", "temporal modeling", "video prediction", "spatiotemporal"],
-            "3d_spatial": ["3D reconstruction", "NeRF", "Gaussian splatting", "3D generation", "point cloud", "depth estimation", "3D vision", "spatial AI"],
-            # 생성 모델
-            "image_generation": ["diffusion model", "image generation", "text-to-image", "Stable Diffusion", "DALL-E", "image synthesis", "generative model"],
-            "audio_speech": ["text-to-speech", "TTS", "speech recognition", "ASR", "audio generation", "voice synthesis", "speech synthesis", "audio LLM"],
-            # 학습 & 최적화
-            "reinforcement_learning": ["reinforcement learning", "RL", "RLHF", "policy optimization", "reward model", "PPO", "decision making", "offline RL"],
-            "efficient_ai": ["model compression", "quantization", "pruning", "distillation", "efficient inference", "lightweight model", "edge AI", "PEFT", "LoRA"],
-            # 응용 & 안전
-            "robotics": ["robotics", "robot learning", "manipulation", "navigation", "embodied AI", "robot control", "autonomous robot"],
-            "scientific_ai": ["AI for science", "AlphaFold", "protein structure", "drug discovery", "molecular generation", "scientific discovery", "chemistry AI"],
-            "ai_safety": ["AI safety", "alignment", "RLHF", "red teaming", "jailbreak", "constitutional AI", "interpretability", "explainable AI", "fairness"],
-        }
-
         results = {}
         all_papers = []
-        global_exclude = set()  # 전체 중복 방지
-
-        for field in fields:
-            category = field_to_category.get(field, "Computer Vision")
-            keywords = field_keywords.get(field, ["machine learning", "deep learning"])
-
-            logger.info(f"[{field}] 검색 시작: {category} (목표: {count_per_field}개)")
+        global_exclude = set()  # 전체 중복 방지 (분야 워커 간 공유)
+        exclude_lock = threading.Lock()
 
-            field_papers = []
-            attempts = 0
-            max_attempts = 3  # 최대 재시도 횟수
-
-            while len(field_papers) < count_per_field and attempts < max_attempts:
-                attempts += 1
-                needed = count_per_field - len(field_papers)
-
-                try:
-                    # 검색 시도 (재시도 활성화)
-                    papers = self.search(
-                        category=category,
-                        keywords=keywords,
-                        count=needed + 2,  # 여유분 확보
-                        source_count=3,  # 더 많은 소스 사용
-                        exclude_titles=list(global_exclude),
-                        retry_on_failure=True
-                    )
-
-                    # 중복 제거 및 추가
-                    for paper in papers:
-                        title = paper.get("title", "")
-                        title_lower = title.lower()
-
-                        if title and title_lower not in global_exclude:
-                            paper["field"] = field
-                            paper["field_name"] = category
-                            field_papers.append(paper)
-                            global_exclude.add(title_lower)
-
-                            if len(field_papers) >= count_per_field:
-                                break
+        field_categories = {f: _FIELD_TO_CATEGORY.get(f, "Computer Vision") for f in fields}
+        keywords_map = {
+            field_categories[f]: list(_FIELD_KEYWORDS.get(f, _DEFAULT_FIELD_KEYWORDS))
+            for f in fields
+        }
 
-                    if papers:
-                        logger.info(f"[{field}] 시도 {attempts}: {len(papers)}개 검색, 현재 {len(field_papers)}/{count_per_field}개")
+        # 1단계 — 배치 경로: 배치 검색을 재정의한 소스는 HTTP 요청 한 번으로
+        # 전 분야를 커버 (분야 × 소스 × 시도 횟수만큼 요청하던 것을 소스당 1회로)
+        field_results: Dict[str, List[Dict]] = {f: [] for f in fields}
+        for source in self._priority_sources:
+            pending = [f for f in fields if len(field_results[f]) < count_per_field]
+            if not pending:
+                break
+            if type(source).search_batch is PaperSource.search_batch:
+                continue  # 배치 미지원 소스는 2단계 폴백에 맡김
 
-                except Exception as e:
-                    logger.error(f"[{field}] 시도 {attempts} 실패: {e}")
+            categories = list(dict.fromkeys(field_categories[f] for f in pending))
+            try:
+                by_category = self._rate_limited_batch(source, categories, keywords_map, count_per_field + 2)
+            except Exception as e:
+                logger.warning(f"[{source.name}] 배치 검색 실패: {e}")
+                continue
 
-                # API 레이트 리밋 방지
-                if len(field_papers) < count_per_field:
-                    time.sleep(1)
+            for field in pending:
+                for paper in by_category.get(field_categories[field], []):
+                    if len(field_results[field]) >= count_per_field:
+                        break
+                    title_lower = _title_key(paper)
+                    if title_lower and title_lower not in global_exclude:
+                        global_exclude.add(title_lower)
+                        paper["field"] = field
+                        paper["field_name"] = field_categories[field]
+                        field_results[field].append(paper)
+
+        # 2단계 — 배치로 못 채운 분야만 기존 분야별 동시 검색으로 보충
+        # 주의: self._executor는 search() 내부의 소스 호출용이므로, 분야 단위
+        # 작업을 거기에 제출하면 워커를 점유해 교착이 생길 수 있음 → 별도 풀 사용
+        short_fields = [f for f in fields if len(field_results[f]) < count_per_field]
+        if short_fields:
+            with ThreadPoolExecutor(max_workers=min(4, len(short_fields))) as field_executor:
+                futures = {
+                    field_executor.submit(
+                        self._search_field,
+                        field,
+                        field_categories[field],
+                        _FIELD_KEYWORDS.get(field, _DEFAULT_FIELD_KEYWORDS),
+                        count_per_field - len(field_results[field]),
+                        global_exclude,
+                        exclude_lock,
+                    ): field
+                    for field in short_fields
+                }
+                for future in as_completed(futures):
+                    field = futures[future]
+                    try:
+                        field_results[field].extend(future.result())
+                    except Exception as e:
+                        logger.error(f"[{field}] 검색 실패: {e}")
 
-            # 결과 저장
-            results[field] = field_papers[:count_per_field]
+        # 요청한 분야 순서대로 결과 병합
+        for field in fields:
+            results[field] = field_results.get(field, [])
             all_papers.extend(results[field])
 
             if len(results[field]) < count_per_field:
@@ -1169,9 +1674,6 @@ class PaperSearcher:
             else:
                 logger.info(f"[{field}] 완료: {len(results[field])}개 검색")
 
-            # 분야 간 대기
-            time.sleep(0.5)
-
         # papers.json에 저장
         if all_papers:
             self._save_to_papers_json(all_papers)
@@ -1179,54 +1681,184 @@ class PaperSearcher:
 
         return results
 
+    def _search_field(
+        self,
+        field: str,
+        category: str,
+        keywords: List[str],
+        count_per_field: int,
+        global_exclude: set,
+        exclude_lock: threading.Lock
+    ) -> List[Dict]:
+        """
+        단일 분야 검색 워커 (search_latest_papers에서 분야별로 동시 실행)
+
+        global_exclude는 워커 간 공유되므로 exclude_lock으로 보호합니다.
+        """
+        logger.info(f"[{field}] 검색 시작: {category} (목표: {count_per_field}개)")
+
+        field_papers = []
+        attempts = 0
+        max_attempts = 3  # 최대 재시도 횟수
+
+        while len(field_papers) < count_per_field and attempts < max_attempts:
+            attempts += 1
+            needed = count_per_field - len(field_papers)
+
+            try:
+                with exclude_lock:
+                    exclude_snapshot = list(global_exclude)
+
+                # 검색 시도 (재시도 활성화)
+                papers = self.search(
+                    category=category,
+                    keywords=keywords,
+                    count=needed + 2,  # 여유분 확보
+                    source_count=3,  # 더 많은 소스 사용
+                    exclude_titles=exclude_snapshot,
+                    retry_on_failure=True
+                )
+
+                # 중복 제거 및 추가
+                for paper in papers:
+                    title = paper.get("title", "")
+                    title_lower = _title_key(paper)
+
+                    if not title:
+                        continue
+
+                    with exclude_lock:
+                        if title_lower in global_exclude:
+                            continue
+                        global_exclude.add(title_lower)
+
+                    paper["field"] = field
+                    paper["field_name"] = category
+                    field_papers.append(paper)
+
+                    if len(field_papers) >= count_per_field:
+                        break
+
+                if papers:
+                    logger.info(f"[{field}] 시도 {attempts}: {len(papers)}개 검색, 현재 {len(field_papers)}/{count_per_field}개")
+
+            except Exception as e:
+                logger.error(f"[{field}] 시도 {attempts} 실패: {e}")
+
+        return field_papers[:count_per_field]
+
     def _save_to_papers_json(self, papers: List[Dict]) -> None:
         """검색된 논문을 papers.json에 저장"""
         papers_file = PROJECT_ROOT / "data" / "papers.json"
 
         try:
-            # 기존 데이터 로드
-            existing_papers = []
-            if papers_file.exists():
-                with open(papers_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        existing_papers = data
-                    elif isinstance(data, dict) and "papers" in data:
-                        existing_papers = data.get("papers", [])
-
-            # 기존 논문 제목 집합 (중복 체크용)
-            existing_titles = {p.get("title", "").lower() for p in existing_papers if p.get("title")}
-
-            # 새 논문 추가 (중복 제외)
-            added_count = 0
-            for paper in papers:
-                title = paper.get("title", "")
-                if title and title.lower() not in existing_titles:
-                    # papers.json 형식에 맞게 변환
-                    paper_entry = {
-                        "title": title,
-                        "year": paper.get("year", datetime.now().year),
-                        "authors": paper.get("authors", []),
-                        "arxiv_id": paper.get("arxiv_id", ""),
-                        "url": paper.get("url", ""),
-                        "pdf_url": paper.get("pdf_url", ""),
-                        "abstract": paper.get("abstract", ""),
-                        "source": paper.get("source", ""),
-                        "field": paper.get("field", ""),
-                        "citations": paper.get("citations", 0),
-                        "added_at": datetime.now().isoformat(),
-                        "status": "pending",  # 리뷰 생성 대기
-                    }
-                    existing_papers.insert(0, paper_entry)  # 최신 논문을 앞에 추가
-                    existing_titles.add(title.lower())
-                    added_count += 1
-
-            # 저장
-            papers_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(papers_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_papers, f, ensure_ascii=False, indent=2)
-
-            logger.info(f"papers.json에 {added_count}개 논문 추가 (총 {len(existing_papers)}개)")
+            now = datetime.now()
+            # 최상위가 배열인 파일은 ijson으로 스트리밍 병합 (전체 로드 불필요)
+            if IJSON_AVAILABLE and self._json_array_on_disk(papers_file):
+                added_count, total = self._merge_papers_streaming(papers_file, papers, now)
+            else:
+                added_count, total = self._merge_papers_in_memory(papers_file, papers, now)
+
+            logger.info(f"papers.json에 {added_count}개 논문 추가 (총 {total}개)")
 
         except Exception as e:
             logger.error(f"papers.json 저장 실패: {e}")
+
+    @staticmethod
+    def _new_paper_entries(papers: List[Dict], existing_titles: set, now: datetime) -> List[Dict]:
+        """papers.json 형식의 신규 항목 목록 생성 (기존/배치 내 중복 제목 제외)
+
+        배치 전체 키를 먼저 계산하고, 기존 제목과의 차집합을 C 레벨 집합 연산으로 구함
+        """
+        added_at = now.isoformat()
+        candidate_keys = [_title_key(paper) for paper in papers]
+        fresh_keys = set(candidate_keys) - existing_titles - {""}
+        new_entries = []
+        for paper, title_lower in zip(papers, candidate_keys):
+            if title_lower not in fresh_keys:
+                continue
+            fresh_keys.discard(title_lower)  # 배치 내 같은 제목은 첫 항목만
+            # papers.json 형식에 맞게 변환
+            new_entries.append({
+                "title": paper.get("title", ""),
+                "year": paper.get("year", now.year),
+                "authors": paper.get("authors", []),
+                "arxiv_id": paper.get("arxiv_id", ""),
+                "url": paper.get("url", ""),
+                "pdf_url": paper.get("pdf_url", ""),
+                "abstract": paper.get("abstract", ""),
+                "source": paper.get("source", ""),
+                "field": paper.get("field", ""),
+                "citations": paper.get("citations", 0),
+                "added_at": added_at,
+                "status": "pending",  # 리뷰 생성 대기
+            })
+        return new_entries
+
+    @staticmethod
+    def _json_array_on_disk(path: Path) -> bool:
+        """파일 최상위가 JSON 배열인지 첫 바이트로 판별 (스트리밍 병합 가능 여부)"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(64).lstrip().startswith(b'[')
+        except OSError:
+            return False
+
+    def _merge_papers_streaming(self, papers_file: Path, papers: List[Dict], now: datetime):
+        """기존 배열을 통째로 올리지 않고 스트리밍 병합 (피크 메모리 O(신규 항목 수))
+
+        1차 통과로 제목 집합만 수집하고, 2차 통과에서 신규 항목 + 기존 항목을
+        임시 파일에 하나씩 복사한 뒤 os.replace로 교체한다.
+        """
+        with open(papers_file, 'rb') as f:
+            existing_titles = {(item.get("title") or "").lower()
+                               for item in ijson.items(f, 'item', use_float=True)}
+        existing_titles.discard("")
+
+        new_entries = self._new_paper_entries(papers, existing_titles, now)
+
+        tmp_file = papers_file.with_suffix(papers_file.suffix + '.tmp')
+        total = 0
+        with open(tmp_file, 'w', encoding='utf-8') as out, open(papers_file, 'rb') as src:
+            out.write('[\n')
+            for entry in new_entries[::-1]:  # 최신 논문이 앞에 오도록
+                out.write(('' if total == 0 else ',\n') + _dumps_entry(entry))
+                total += 1
+            for entry in ijson.items(src, 'item', use_float=True):
+                out.write(('' if total == 0 else ',\n') + _dumps_entry(entry))
+                total += 1
+            out.write('\n]')
+        os.replace(tmp_file, papers_file)
+
+        return len(new_entries), total
+
+    def _merge_papers_in_memory(self, papers_file: Path, papers: List[Dict], now: datetime):
+        """전체 로드 후 병합 (ijson이 없거나 배열 형태가 아닌 경우의 폴백)"""
+        existing_papers = []
+        if papers_file.exists():
+            with open(papers_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                if isinstance(data, list):
+                    existing_papers = data
+                elif isinstance(data, dict) and "papers" in data:
+                    existing_papers = data.get("papers", [])
+
+        # 기존 논문 제목 집합 (중복 체크용) — 디스크에서 온 항목에는 키를 메모하지 않음
+        existing_titles = {p.get("title", "").lower() for p in existing_papers if p.get("title")}
+
+        new_entries = self._new_paper_entries(papers, existing_titles, now)
+
+        # 최신 논문을 앞에 두되, 항목마다 insert(0) 하는 O(N²) 대신 한 번의 연결로
+        all_entries = list(reversed(new_entries)) + existing_papers
+
+        # 저장 — 임시 파일에 쓴 뒤 os.replace로 교체 (쓰다 죽어도 기존 파일 보존)
+        papers_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = papers_file.with_suffix(papers_file.suffix + '.tmp')
+        if ORJSON_AVAILABLE:
+            tmp_file.write_bytes(orjson.dumps(all_entries, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(all_entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, papers_file)
+
+        return len(new_entries), len(all_entries)
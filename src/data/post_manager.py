@@ -6,47 +6,103 @@ import os
 from pathlib import Path
 from typing import Optional
 
+# 저널 항목이 이 개수를 넘으면 스냅샷으로 압축
+_COMPACT_EVERY = 100
+
 
 class PostManager:
     """포스트 번호 및 상태 관리"""
-    
+
     def __init__(self, state_file: str = "data/post_state.json"):
         """
         Args:
             state_file: 상태를 저장할 파일 경로
         """
         self.state_file = Path(state_file)
+        # 번호 증가는 전체 JSON 재작성 대신 저널에 한 줄 추가로 기록
+        self.journal_file = self.state_file.with_suffix('.log')
         # 디렉토리가 없으면 생성
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self.state = self._load_state()
-    
+        self._journal_entries = self._count_journal_entries()
+
     def _load_state(self) -> dict:
-        """상태 파일 로드"""
+        """상태 파일 로드 (스냅샷 + 저널 재생)"""
+        state = {'last_number': 0}
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    state = json.load(f)
             except Exception as e:
                 print(f"상태 파일 로드 실패: {e}")
-                return {'last_number': 0}
-        return {'last_number': 0}
-    
+
+        # 스냅샷 이후의 증가분은 저널에 있으므로 마지막 유효 줄로 덮어씀
+        if self.journal_file.exists():
+            try:
+                last_line = ""
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            last_line = line.strip()
+                if last_line.isdigit():
+                    state['last_number'] = max(state.get('last_number', 0), int(last_line))
+            except Exception as e:
+                print(f"저널 파일 로드 실패: {e}")
+
+        return state
+
+    def _count_journal_entries(self) -> int:
+        """현재 저널에 쌓인 항목 수 (압축 시점 판단용)"""
+        if not self.journal_file.exists():
+            return 0
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                return sum(1 for line in f if line.strip())
+        except Exception:
+            return 0
+
     def _save_state(self):
-        """상태 파일 저장"""
+        """상태 파일 저장 (임시 파일 + os.replace로 원자적 교체)"""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
+            tmp = self.state_file.with_suffix(self.state_file.suffix + '.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
                 json.dump(self.state, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.state_file)
         except Exception as e:
             print(f"상태 파일 저장 실패: {e}")
-    
+
+    def _append_journal(self, number: int):
+        """저널에 새 번호 한 줄 추가 (상태 크기와 무관한 O(1) 쓰기)"""
+        fd = os.open(self.journal_file, os.O_APPEND | os.O_CREAT | os.O_WRONLY, 0o644)
+        try:
+            os.write(fd, f"{number}\n".encode())
+        finally:
+            os.close(fd)
+
+    def _compact_journal(self):
+        """저널을 스냅샷으로 접고 비움"""
+        self._save_state()
+        try:
+            self.journal_file.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"저널 파일 정리 실패: {e}")
+        self._journal_entries = 0
+
     def get_next_post_number(self) -> int:
         """다음 포스트 번호 가져오기"""
         next_number = self.state.get('last_number', 0) + 1
         self.state['last_number'] = next_number
-        self._save_state()
+        try:
+            self._append_journal(next_number)
+            self._journal_entries += 1
+            if self._journal_entries >= _COMPACT_EVERY:
+                self._compact_journal()
+        except Exception as e:
+            # 저널 추가 실패 시 전체 스냅샷으로 폴백 (번호 유실 방지)
+            print(f"저널 기록 실패, 스냅샷으로 저장: {e}")
+            self._save_state()
         return next_number
-    
+
     def get_post_title(self, number: int) -> str:
         """포스트 제목 생성"""
         return f"AI논문 리뷰_{number}"
-
@@ -2,6 +2,7 @@
 쿠키 갱신 유틸리티 (주기적으로 쿠키 갱신)
 """
 import logging
+import os
 import yaml
 from pathlib import Path
 from typing import Optional
@@ -14,6 +15,10 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# libyaml이 있으면 C 구현 로더/덤퍼 사용 (순수 파이썬 대비 수 배 빠름)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class CookieRefresher:
     """쿠키 갱신 관리자"""
@@ -28,28 +33,40 @@ class CookieRefresher:
         """
         self.config_path = Path(config_path)
         self.cookie_file = Path(cookie_file) if cookie_file else Path(config_path).parent / "data" / "cookies.json"
-        
+        # (mtime, 파싱 결과) 캐시 — 파일이 안 바뀌었으면 YAML 재파싱 생략
+        self._config_cache: Optional[tuple] = None
+
     def load_config(self) -> dict:
-        """설정 파일 로드"""
+        """설정 파일 로드 (mtime이 같으면 캐시 반환)"""
+        mtime = os.stat(self.config_path).st_mtime
+        if self._config_cache is not None and self._config_cache[0] == mtime:
+            return self._config_cache[1]
+
         with open(self.config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        self._config_cache = (mtime, config)
+        return config
+
     def save_cookies_to_config(self, cookies: str):
         """쿠키를 config.yaml에 저장"""
         try:
             # 설정 파일 읽기
             config = self.load_config()
-            
+
             # 쿠키 업데이트
             if 'tistory' not in config:
                 config['tistory'] = {}
-            
+
             config['tistory']['cookies'] = cookies
-            
+
             # 설정 파일 저장
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-            
+                yaml.dump(config, f, Dumper=_YAML_DUMPER, allow_unicode=True,
+                          default_flow_style=False, sort_keys=False)
+
+            # 방금 쓴 내용을 캐시에 반영 (다음 load_config에서 재파싱 불필요)
+            self._config_cache = (os.stat(self.config_path).st_mtime, config)
+
             logger.info(f"쿠키가 config.yaml에 저장되었습니다: {self.config_path}")
         except Exception as e:
             logger.error(f"config.yaml 쿠키 저장 실패: {e}")
@@ -70,33 +87,30 @@ class CookieRefresher:
             return False
         
         try:
+            # 강제 갱신이 아니면 마지막 갱신 시간부터 확인
+            # (파일 mtime만 보는 stat 한 번 — JSON 파싱도 YAML 로드도 불필요)
+            if not force:
+                try:
+                    age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(self.cookie_file))
+                    # 7일 이상 지났을 때만 갱신
+                    if age.days < 7:
+                        logger.debug(f"쿠키가 아직 유효합니다 ({age.days}일 경과). 갱신 건너뜁니다.")
+                        return True
+                except OSError:
+                    pass  # 쿠키 파일이 아직 없으면 갱신 경로로
+                except Exception as e:
+                    logger.debug(f"쿠키 파일 확인 중 오류: {e}")
+
             config = self.load_config()
             browser_auth_config = config.get('browser_auth', {})
-            
+
             kakao_email = browser_auth_config.get('kakao_email')
             kakao_password = browser_auth_config.get('kakao_password')
-            
+
             if not kakao_email or not kakao_password:
                 logger.debug("카카오 계정 정보가 설정되지 않아 쿠키 자동 갱신을 건너뜁니다.")
                 return False
-            
-            # 강제 갱신이 아니면 마지막 갱신 시간 확인
-            if not force and self.cookie_file.exists():
-                try:
-                    import json
-                    with open(self.cookie_file, 'r', encoding='utf-8') as f:
-                        cookie_data = json.load(f)
-                    updated_at_str = cookie_data.get('updated_at')
-                    if updated_at_str:
-                        updated_at = datetime.fromisoformat(updated_at_str)
-                        age = datetime.now() - updated_at
-                        # 7일 이상 지났을 때만 갱신
-                        if age.days < 7:
-                            logger.debug(f"쿠키가 아직 유효합니다 ({age.days}일 경과). 갱신 건너뜁니다.")
-                            return True
-                except Exception as e:
-                    logger.debug(f"쿠키 파일 확인 중 오류: {e}")
-            
+
             # 쿠키 갱신
             headless = browser_auth_config.get('headless', True)
             
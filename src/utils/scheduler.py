@@ -25,19 +25,14 @@ class RandomScheduler:
         self.end_hour = end_hour
         self.end_minute = end_minute
         self.scheduler = BlockingScheduler()
-    
+        # 허용 구간을 초 단위로 미리 계산 (시/분/초 3회 추첨 대신 1회 추첨)
+        self._start_secs = start_hour * 3600
+        self._end_secs = end_hour * 3600 + end_minute * 60 + 59
+
     def _generate_random_time_for_date(self, target_date) -> datetime:
-        """특정 날짜의 랜덤 시간 생성"""
-        random_hour = random.randint(self.start_hour, self.end_hour)
-        
-        if random_hour == self.end_hour:
-            random_minute = random.randint(0, self.end_minute)
-        else:
-            random_minute = random.randint(0, 59)
-        
-        random_second = random.randint(0, 59)
-        
-        return datetime.combine(target_date, time(random_hour, random_minute, random_second))
+        """특정 날짜의 랜덤 시간 생성 (구간 전체에서 균일한 초 하나 추첨)"""
+        delta = random.randrange(self._start_secs, self._end_secs + 1)
+        return datetime.combine(target_date, time(0)) + timedelta(seconds=delta)
     
     def schedule_daily_random(self, job_func: Callable):
         """